@@ -6,23 +6,32 @@ Zero-dependency CLI tool that analyzes ALAS logs and produces actionable summari
 Supports multiple output modes: summary, timeline, errors, combat stats, and more.
 """
 
+import io
+import mmap
+import os
 import re
 import sys
 import argparse
 import json
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Iterator, TextIO, Any
+from typing import Optional, List, Dict, Iterable, Iterator, TextIO, Any, Tuple
 from collections import defaultdict, Counter
 from enum import Enum
 
+try:
+    import orjson  # Optional: faster --json output
+except ImportError:
+    orjson = None
+
 
 # ============================================================================
 # Data Structures
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LogLine:
     """Represents a single parsed log line"""
     line_number: int
@@ -32,15 +41,16 @@ class LogLine:
     raw: str = ""
     is_separator: bool = False
     separator_title: Optional[str] = None
-    continuation_lines: List[str] = field(default_factory=list)
+    # None until the first continuation line arrives; most entries have none
+    continuation_lines: Optional[List[str]] = None
 
     def full_message(self) -> str:
         """Get complete message including continuation lines"""
         if not self.continuation_lines:
             return self.message
-        return self.message + "\n" + "\n".join(self.continuation_lines)
+        return "\n".join([self.message, *self.continuation_lines])
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     """
     Shared state context passed between analyzers (The "Event Bus").
@@ -63,27 +73,62 @@ class SessionState:
 class LogParser:
     """Parses ALAS log files into structured LogLine objects"""
 
-    # Pattern: 2026-01-25 12:00:59.205 | INFO | Message
-    LOG_PATTERN = re.compile(
-        r'^(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d{3})\s*\|\s*(\w+)\s*\|\s*(.*)$'
+    # One pass per line: either a separator (═══…, 50+ chars) or a log entry
+    # "2026-01-25 12:00:59.205 | INFO | Message".  The named group that
+    # matched tells parse() which branch to take.
+    LINE_PATTERN = re.compile(
+        r'^(?:(?P<sep>[═─]{50,})'
+        r'|(?P<ts>\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d{3})\s*\|\s*(?P<level>\w+)\s*\|\s*(?P<msg>.*))$'
     )
 
-    # Separator line patterns
-    SEPARATOR_PATTERN = re.compile(r'^[═─]{50,}$')
+    # Separator title pattern
     TITLE_PATTERN = re.compile(r'^[═─\s]+([A-Z\s]+?)[═─\s]*$')
 
+    @staticmethod
+    def parse_timestamp(timestamp_str: str) -> datetime:
+        """Parse "YYYY-MM-DD HH:MM:SS.mmm" without going through strptime.
+
+        strptime re-interprets its format string (and checks the locale) on
+        every call, which made it the single most expensive step of parsing.
+        ALAS always writes this fixed layout, which datetime.fromisoformat
+        (implemented in C) parses directly.  fromisoformat also accepts
+        other ISO forms ('T' separator, week dates, ',' fractions), so it is
+        only tried when the separators are exactly ALAS's; anything else
+        (e.g. the whitespace runs LINE_PATTERN allows, or non-ASCII digits)
+        goes through strptime, which decides what is valid.
+        """
+        # Characters 4, 7, 10, 13, 16 and 19 of "YYYY-MM-DD HH:MM:SS.mmm"
+        if len(timestamp_str) == 23 and timestamp_str[4:20:3] == '-- ::.':
+            try:
+                return datetime.fromisoformat(timestamp_str)
+            except ValueError:
+                pass
+        return datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S.%f')
+
     @classmethod
-    def parse(cls, lines: Iterator[str]) -> Iterator[LogLine]:
-        """Parse log lines into structured LogLine objects"""
-        line_num = 0
+    def parse(cls, lines: Iterator[str], start_line: int = 0) -> Iterator[LogLine]:
+        """Parse log lines into structured LogLine objects
+
+        start_line is the number of lines preceding *lines* in the file, so
+        line numbers stay file-relative when parsing a segment.
+        """
+        # Hoisted so the per-line loop does no class attribute lookups
+        parse_timestamp = cls.parse_timestamp
+        intern = sys.intern
+        match_line = cls.LINE_PATTERN.match
+        line_num: int = start_line
         current_log: Optional[LogLine] = None
+        line: str
+        stripped: str
 
         for raw_line in lines:
             line_num += 1
             line = raw_line.rstrip('\n\r')
 
+            match = match_line(line)
+
             # Check for separator lines
-            if cls.SEPARATOR_PATTERN.match(line):
+            if match and match.lastgroup == 'sep':
                 if current_log:
                     yield current_log
                     current_log = None
@@ -103,17 +148,17 @@ class LogParser:
                 )
                 continue
 
-            # Try to parse as log line
-            match = cls.LOG_PATTERN.match(line)
-
             if match:
                 # Yield previous log if exists
                 if current_log:
                     yield current_log
 
                 # Parse new log line
-                timestamp_str, level, message = match.groups()
-                timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S.%f')
+                timestamp_str, level, message = match.group('ts', 'level', 'msg')
+                timestamp = parse_timestamp(timestamp_str)
+                # Only a handful of distinct levels; interning makes every
+                # later level comparison a pointer check
+                level = intern(level)
 
                 current_log = LogLine(
                     line_number=line_num,
@@ -123,16 +168,21 @@ class LogParser:
                     raw=line
                 )
             else:
+                stripped = line.strip()
+                if not stripped:
+                    continue
+
                 # Continuation line
-                if current_log and line.strip():
-                    current_log.continuation_lines.append(line)
-                elif line.strip():
+                if current_log:
+                    if current_log.continuation_lines is None:
+                        current_log.continuation_lines = [line]
+                    else:
+                        current_log.continuation_lines.append(line)
+                else:
                     # Orphan line (no parent log entry)
-                    if current_log:
-                        yield current_log
                     current_log = LogLine(
                         line_number=line_num,
-                        message=line.strip(),
+                        message=stripped,
                         raw=line
                     )
 
@@ -145,15 +195,28 @@ class LogParser:
 # Analyzers
 # ============================================================================
 
+# Level guards shared by analyzers (levels are interned by LogParser.parse)
+ERROR_LEVELS = frozenset({'ERROR', 'CRITICAL'})
+CONNECTION_LEVELS = frozenset({'ERROR', 'WARNING'})
+
 class BaseAnalyzer:
     """Base class for all analyzers"""
+
+    # Substrings at least one of which a message must contain for feed() to
+    # have any effect. Empty means the analyzer must see every line.
+    ANCHORS: Tuple[str, ...] = ()
+
     def feed(self, log: LogLine, state: SessionState):
         pass
     
     def finalize(self, state: SessionState):
         pass
 
-@dataclass
+    def merge(self, other: 'BaseAnalyzer'):
+        """Fold in results from the segment of the log that follows this one"""
+        pass
+
+@dataclass(slots=True)
 class TaskRun:
     """Represents a single task execution"""
     name: str
@@ -174,6 +237,9 @@ class TaskRun:
 class TaskAnalyzer(BaseAnalyzer):
     """Tracks task lifecycle and execution"""
 
+    START_TASK_PATTERN = re.compile(r"Start task `([^`]+)`")
+    EXCEPTION_PATTERN = re.compile(r'(\w+Error|\w+Exception):')
+
     def __init__(self):
         self.tasks: List[TaskRun] = []
         self.current_task: Optional[TaskRun] = None
@@ -188,9 +254,10 @@ class TaskAnalyzer(BaseAnalyzer):
 
         # Task start: "Scheduler: Start task `TaskName`"
         if "Scheduler: Start task" in msg:
-            match = re.search(r"Start task `([^`]+)`", msg)
+            match = self.START_TASK_PATTERN.search(msg)
             if match:
-                task_name = match.group(1)
+                # Interned: one string per task name, shared by every TaskRun
+                task_name = sys.intern(match.group(1))
                 
                 # Update shared state
                 state.current_task = task_name
@@ -212,7 +279,7 @@ class TaskAnalyzer(BaseAnalyzer):
         # Section headers (alternative task markers)
         elif log.is_separator and log.separator_title:
             title = log.separator_title
-            if title and title not in ['START', 'DEVICE']:
+            if title and title not in ('START', 'DEVICE'):
                 # This might be a task section
                 if self.current_task and not self.current_task.start_time:
                     self.current_task.start_time = log.timestamp
@@ -226,22 +293,41 @@ class TaskAnalyzer(BaseAnalyzer):
                 state.current_task = None
 
         # Error in current task
-        elif log.level in ['ERROR', 'CRITICAL'] and self.current_task:
+        elif log.level in ERROR_LEVELS and self.current_task:
             self.current_task.success = False
             # Try to extract exception type
-            exc_match = re.search(r'(\w+Error|\w+Exception):', msg)
-            if exc_match:
-                self.current_task.error_type = exc_match.group(1)
+            if 'Error' in msg or 'Exception' in msg:
+                exc_match = self.EXCEPTION_PATTERN.search(msg)
+                if exc_match:
+                    self.current_task.error_type = sys.intern(exc_match.group(1))
 
     def finalize(self, state: SessionState):
         """Called when parsing is complete"""
         if self.current_task and state.last_timestamp:
             self.current_task.end_time = state.last_timestamp
 
+    def merge(self, other: 'TaskAnalyzer'):
+        """Append tasks from the following segment.
+
+        A task still open at the end of this segment is closed where the next
+        segment starts its first task.  Errors or Delay/Skip lines that occur
+        in the next segment before that point are not attributed to it.
+        """
+        if other.tasks:
+            if self.current_task:
+                self.current_task.end_time = other.tasks[0].start_time
+                self.current_task.line_end = other.tasks[0].line_start
+            self.current_task = other.current_task
+        self.tasks.extend(other.tasks)
+        self.task_counts.update(other.task_counts)
+
 
 class ErrorAnalyzer(BaseAnalyzer):
     """Tracks errors, warnings, and exceptions"""
 
+    SAVING_ERROR_PATTERN = re.compile(r'Saving error:\s*(.+)')
+    EXCEPTION_PATTERN = re.compile(r'(\w+(?:Error|Exception)):')
+
     def __init__(self):
         self.errors: List[LogLine] = []
         self.warnings: List[LogLine] = []
@@ -251,11 +337,6 @@ class ErrorAnalyzer(BaseAnalyzer):
 
     def feed(self, log: LogLine, state: SessionState):
         """Process a log line for errors"""
-        msg = log.full_message()
-
-        # Detect crashes (Tracebacks or Function calls in INFO)
-        is_traceback = "Traceback (most recent call last):" in msg or "Function calls:" in msg
-        
         if log.level == 'ERROR':
             self.errors.append(log)
             self._extract_exception(log, state)
@@ -264,7 +345,7 @@ class ErrorAnalyzer(BaseAnalyzer):
         elif log.level == 'CRITICAL':
             self.criticals.append(log)
             self._extract_exception(log, state)
-        elif is_traceback and log.level == 'INFO':
+        elif log.level == 'INFO' and self._is_traceback(log):
             # OPINIONATED CHANGE: Treat INFO-level tracebacks as exceptions.
             # Why: ALAS often logs "GameStuckError" or stack traces as INFO to avoid
             # polluting the console with red text. Without this, the parser thinks
@@ -273,28 +354,65 @@ class ErrorAnalyzer(BaseAnalyzer):
 
         # Detect error saves
         if "Saving error:" in log.message:
-            match = re.search(r'Saving error:\s*(.+)', log.message)
+            match = self.SAVING_ERROR_PATTERN.search(log.message)
             if match:
                 self.error_saves.append(match.group(1))
 
+    @staticmethod
+    def _is_traceback(log: LogLine) -> bool:
+        """Detect crashes (Tracebacks or Function calls) in a log entry.
+
+        Checks the message and each continuation line separately rather than
+        joining full_message(): the markers contain no newline, so the result
+        is the same without building a string for every INFO line.
+        """
+        msg = log.message
+        if "Traceback (most recent call last):" in msg or "Function calls:" in msg:
+            return True
+        if log.continuation_lines:
+            for line in log.continuation_lines:
+                if "Traceback (most recent call last):" in line or "Function calls:" in line:
+                    return True
+        return False
+
     def _extract_exception(self, log: LogLine, state: SessionState):
-        """Extract exception type from log message"""
-        msg = log.full_message()
+        """Extract exception type from log message
+
+        EXCEPTION_PATTERN cannot span a newline, so searching the message and
+        then each continuation line finds the same first match as searching
+        full_message(), without joining it.
+        """
+        match = self._search_exception(log.message)
+        if not match and log.continuation_lines:
+            for line in log.continuation_lines:
+                if match := self._search_exception(line):
+                    break
 
         # Pattern: ExceptionName: message
-        match = re.search(r'(\w+(?:Error|Exception)):', msg)
         if match:
-            exc_name = match.group(1)
+            exc_name = sys.intern(match.group(1))
             self.exception_counts[exc_name] += 1
             
             # Update shared state
             state.last_crash_error = exc_name
 
+    def _search_exception(self, text: str) -> Optional[re.Match]:
+        if 'Error' in text or 'Exception' in text:
+            return self.EXCEPTION_PATTERN.search(text)
+        return None
+
+    def merge(self, other: 'ErrorAnalyzer'):
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        self.criticals.extend(other.criticals)
+        self.exception_counts.update(other.exception_counts)
+        self.error_saves.extend(other.error_saves)
+
 
 class CombatAnalyzer(BaseAnalyzer):
     """Tracks combat statistics, especially exercise fights"""
 
-    @dataclass
+    @dataclass(slots=True)
     class Fight:
         opponent: Optional[int] = None
         try_num: Optional[int] = None
@@ -304,6 +422,10 @@ class CombatAnalyzer(BaseAnalyzer):
         won: Optional[bool] = None
         crashed: bool = False  # New field for crash detection
 
+    OPPONENT_PATTERN = re.compile(r'OPPONENT:\s*(\d+)')
+    TRY_PATTERN = re.compile(r'TRY:\s*(\d+)')
+    HP_PATTERN = re.compile(r'\[(\d+)%\s*-\s*(\d+)%\]')
+
     def __init__(self):
         self.fights: List[CombatAnalyzer.Fight] = []
         self.current_fight: Optional[CombatAnalyzer.Fight] = None
@@ -313,7 +435,7 @@ class CombatAnalyzer(BaseAnalyzer):
         msg = log.message
 
         # <<< OPPONENT: N >>>
-        if match := re.search(r'OPPONENT:\s*(\d+)', msg):
+        if 'OPPONENT:' in msg and (match := self.OPPONENT_PATTERN.search(msg)):
             # Close previous fight if needed (assume success if not crashed?)
             # Actually, usually a fight ends with a result or a new opponent.
             if self.current_fight:
@@ -327,12 +449,12 @@ class CombatAnalyzer(BaseAnalyzer):
             state.last_crash_error = None # Reset crash for new fight
 
         # <<< TRY: N >>>
-        elif match := re.search(r'TRY:\s*(\d+)', msg):
+        elif 'TRY:' in msg and (match := self.TRY_PATTERN.search(msg)):
             if self.current_fight:
                 self.current_fight.try_num = int(match.group(1))
 
         # HP flow: [XX% - YY%]
-        elif match := re.search(r'\[(\d+)%\s*-\s*(\d+)%\]', msg):
+        elif '%' in msg and (match := self.HP_PATTERN.search(msg)):
             if self.current_fight:
                 self.current_fight.hp_start = int(match.group(1))
                 self.current_fight.hp_end = int(match.group(2))
@@ -361,10 +483,27 @@ class CombatAnalyzer(BaseAnalyzer):
         if self.current_fight:
             self.fights.append(self.current_fight)
 
+    def merge(self, other: 'CombatAnalyzer'):
+        """Append fights from the following segment.
+
+        A fight still open at the end of this segment is closed by the next
+        segment's first opponent; TRY/HP lines for it that fall in the next
+        segment are not attributed to it.
+        """
+        if other.fights or other.current_fight:
+            if self.current_fight:
+                self.fights.append(self.current_fight)
+            self.current_fight = other.current_fight
+        self.fights.extend(other.fights)
+
 
 class AkashiAnalyzer(BaseAnalyzer):
     """Tracks Operation Siren merchant (Akashi) events"""
 
+    ANCHORS = ("Found Akashi", "Bought item:", "Channel mismatch fixed in")
+    PURCHASE_PATTERN = re.compile(r"Bought item:\s*(.+)\.")
+    MISMATCH_PATTERN = re.compile(r"Channel mismatch fixed in ([\w_]+)\. Sim: ([\d.]+)")
+
     def __init__(self):
         self.discoveries: List[LogLine] = []
         self.purchases: List[str] = []
@@ -380,13 +519,13 @@ class AkashiAnalyzer(BaseAnalyzer):
             
         # Purchase: "Bought item: ItemName"
         elif "Bought item:" in msg:
-            match = re.search(r"Bought item:\s*(.+)\.", msg)
+            match = self.PURCHASE_PATTERN.search(msg)
             if match:
                 self.purchases.append(match.group(1))
 
         # Mismatch Warning: "Channel mismatch fixed in TEMPLATE_NAME. Sim: 0.XXX"
         elif "Channel mismatch fixed in" in msg:
-            match = re.search(r"Channel mismatch fixed in ([\w_]+)\. Sim: ([\d.]+)", msg)
+            match = self.MISMATCH_PATTERN.search(msg)
             if match:
                 template_name = match.group(1)
                 sim = float(match.group(2))
@@ -394,16 +533,27 @@ class AkashiAnalyzer(BaseAnalyzer):
                 if sim > self.max_mismatch_sim.get(template_name, 0):
                     self.max_mismatch_sim[template_name] = sim
 
+    def merge(self, other: 'AkashiAnalyzer'):
+        self.discoveries.extend(other.discoveries)
+        self.purchases.extend(other.purchases)
+        self.mismatch_warnings.update(other.mismatch_warnings)
+        for template_name, sim in other.max_mismatch_sim.items():
+            if sim > self.max_mismatch_sim.get(template_name, 0):
+                self.max_mismatch_sim[template_name] = sim
+
 
 class ResourceAnalyzer(BaseAnalyzer):
     """Tracks resource readings from OCR"""
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class Reading:
         resource: str
         value: int
         timestamp: Optional[datetime] = None
 
+    OCR_PATTERN = re.compile(r'\[OCR_(\w+)\]\s*(\d+)')
+    EXERCISE_REMAIN_PATTERN = re.compile(r'exercise.*remain.*?(\d+)', re.IGNORECASE)
+
     def __init__(self):
         self.readings: List[ResourceAnalyzer.Reading] = []
 
@@ -412,7 +562,7 @@ class ResourceAnalyzer(BaseAnalyzer):
         msg = log.message
 
         # [OCR_*] patterns
-        if match := re.search(r'\[OCR_(\w+)\]\s*(\d+)', msg):
+        if '[OCR_' in msg and (match := self.OCR_PATTERN.search(msg)):
             self.readings.append(self.Reading(
                 resource=match.group(1),
                 value=int(match.group(2)),
@@ -420,17 +570,27 @@ class ResourceAnalyzer(BaseAnalyzer):
             ))
 
         # Exercise remain
-        elif match := re.search(r'exercise.*remain.*?(\d+)', msg, re.IGNORECASE):
+        # casefold() is a superset of the IGNORECASE match, so this gate
+        # never hides a line the regex would have accepted.
+        elif ('remain' in (folded := msg.casefold()) and 'exercise' in folded
+              and (match := self.EXERCISE_REMAIN_PATTERN.search(msg))):
             self.readings.append(self.Reading(
                 resource='EXERCISE_REMAIN',
                 value=int(match.group(1)),
                 timestamp=log.timestamp
             ))
 
+    def merge(self, other: 'ResourceAnalyzer'):
+        self.readings.extend(other.readings)
+
 
 class NavigationAnalyzer(BaseAnalyzer):
     """Tracks page navigation and UI interactions"""
 
+    ANCHORS = ("Page switch:", "Click", "Unknown ui page")
+    PAGE_SWITCH_PATTERN = re.compile(r'Page switch:\s*(\S+)\s*->\s*(\S+)')
+    CLICK_PATTERN = re.compile(r'Click\s*\(')
+
     def __init__(self):
         self.page_switches: List[Dict] = []
         self.click_count: int = 0
@@ -441,7 +601,7 @@ class NavigationAnalyzer(BaseAnalyzer):
         msg = log.message
 
         # Page switch: page_x -> page_y
-        if match := re.search(r'Page switch:\s*(\S+)\s*->\s*(\S+)', msg):
+        if 'Page switch:' in msg and (match := self.PAGE_SWITCH_PATTERN.search(msg)):
             self.page_switches.append({
                 'from': match.group(1),
                 'to': match.group(2),
@@ -449,17 +609,25 @@ class NavigationAnalyzer(BaseAnalyzer):
             })
 
         # Click events
-        elif re.search(r'Click\s*\(', msg):
+        elif 'Click' in msg and self.CLICK_PATTERN.search(msg):
             self.click_count += 1
 
         # Unknown pages
         elif 'Unknown ui page' in msg:
             self.unknown_pages += 1
 
+    def merge(self, other: 'NavigationAnalyzer'):
+        self.page_switches.extend(other.page_switches)
+        self.click_count += other.click_count
+        self.unknown_pages += other.unknown_pages
+
 
 class LootAnalyzer(BaseAnalyzer):
     """Tracks acquired items (Ships, Gear, Resources)"""
-    
+
+    PREFIXES = ("Get ", "Acquire ", "Obtain ")
+    ANCHORS = PREFIXES
+
     def __init__(self):
         self.items: Counter = Counter()
         self.recent_loot: List[str] = []
@@ -470,14 +638,21 @@ class LootAnalyzer(BaseAnalyzer):
         # "Get 2x Gold Plate"
         # "Acquire Ship: Enterprise"
         # (Regex needs to be fuzzy as ALAS logging varies)
-        if msg.startswith("Get ") or msg.startswith("Acquire ") or msg.startswith("Obtain "):
+        if msg.startswith(self.PREFIXES):
             self.items[msg] += 1
             self.recent_loot.append(msg)
 
+    def merge(self, other: 'LootAnalyzer'):
+        self.items.update(other.items)
+        self.recent_loot.extend(other.recent_loot)
+
 
 class SkipAnalyzer(BaseAnalyzer):
     """Tracks why tasks were skipped"""
-    
+
+    ANCHORS = ("Skip task",)
+    REASON_PATTERN = re.compile(r'Skip task .* \((Reason: .+?)\)')
+
     def __init__(self):
         self.reasons: Counter = Counter()
 
@@ -485,12 +660,15 @@ class SkipAnalyzer(BaseAnalyzer):
         msg = log.message
         # Skip task Commission (Reason: No available commission)
         if "Skip task" in msg:
-            if match := re.search(r'Skip task .* \((Reason: .+?)\)', msg):
+            if match := self.REASON_PATTERN.search(msg):
                 reason = match.group(1)
                 self.reasons[reason] += 1
             else:
                 self.reasons["Unspecified"] += 1
 
+    def merge(self, other: 'SkipAnalyzer'):
+        self.reasons.update(other.reasons)
+
 
 class DeviceAnalyzer(BaseAnalyzer):
     """Tracks device/ADB connection issues"""
@@ -503,8 +681,9 @@ class DeviceAnalyzer(BaseAnalyzer):
     def feed(self, log: LogLine, state: SessionState):
         """Process a log line for device information"""
         msg = log.message
+        lower = msg.lower()
 
-        if 'AdbTimeout' in msg or 'adb timeout' in msg.lower():
+        if 'AdbTimeout' in msg or 'adb timeout' in lower:
             self.adb_timeouts += 1
 
         if 'MaaTouch' in msg:
@@ -513,11 +692,16 @@ class DeviceAnalyzer(BaseAnalyzer):
                 'timestamp': log.timestamp
             })
 
-        if log.level in ['ERROR', 'WARNING'] and any(
-            kw in msg.lower() for kw in ['connection', 'device', 'adb']
+        if log.level in CONNECTION_LEVELS and (
+            'connection' in lower or 'device' in lower or 'adb' in lower
         ):
             self.connection_errors.append(log)
 
+    def merge(self, other: 'DeviceAnalyzer'):
+        self.adb_timeouts += other.adb_timeouts
+        self.connection_errors.extend(other.connection_errors)
+        self.maatouch_events.extend(other.maatouch_events)
+
 
 # ============================================================================
 # Analyzer Pipeline
@@ -526,6 +710,14 @@ class DeviceAnalyzer(BaseAnalyzer):
 class AnalyzerPipeline:
     """Coordinates multiple analyzers"""
 
+    # One scan for the anchors of every analyzer that ignores lines without
+    # them; most lines match none and skip those feed() calls entirely.
+    ANCHOR_PATTERN = re.compile('|'.join(
+        re.escape(anchor)
+        for analyzer in (NavigationAnalyzer, AkashiAnalyzer, LootAnalyzer, SkipAnalyzer)
+        for anchor in analyzer.ANCHORS
+    ))
+
     def __init__(self):
         self.task = TaskAnalyzer()
         self.error = ErrorAnalyzer()
@@ -548,32 +740,114 @@ class AnalyzerPipeline:
     def feed(self, log: LogLine):
         """Feed a log line to all analyzers"""
         self.total_lines += 1
+        state: SessionState = self.state
 
         # Track session time
-        if log.timestamp:
+        timestamp = log.timestamp
+        if timestamp:
             if not self.start_time:
-                self.start_time = log.timestamp
-            self.end_time = log.timestamp
-            self.state.last_timestamp = log.timestamp
-
-        # Feed to all analyzers
-        self.error.feed(log, self.state)
-        self.task.feed(log, self.state)
-        self.combat.feed(log, self.state)
-        self.resource.feed(log, self.state)
-        self.navigation.feed(log, self.state)
-        self.device.feed(log, self.state)
-        self.akashi.feed(log, self.state)
-        
-        # Feed optional analyzers
-        self.loot.feed(log, self.state)
-        self.skip.feed(log, self.state)
+                self.start_time = timestamp
+            self.end_time = timestamp
+            state.last_timestamp = timestamp
+
+        # Feed to analyzers that need every line
+        self.error.feed(log, state)
+        self.task.feed(log, state)
+        self.combat.feed(log, state)
+        self.resource.feed(log, state)
+        self.device.feed(log, state)
+
+        # Feed anchor-gated analyzers (including the optional ones); none of
+        # them touch the shared state, so running them last is safe
+        if self.ANCHOR_PATTERN.search(log.message):
+            self.navigation.feed(log, state)
+            self.akashi.feed(log, state)
+            self.loot.feed(log, state)
+            self.skip.feed(log, state)
+
+    def feed_batch(self, logs: Iterable[LogLine]):
+        """Feed many log lines; equivalent to calling feed() on each.
+
+        Bound feed methods and the shared state are resolved once rather than
+        per line, and session time bookkeeping is written back once at the
+        end (only finalize() reads state.last_timestamp).
+        """
+        state = self.state
+        # Called directly rather than by looping over a tuple; the inner
+        # loop would cost as much as the attribute lookups it saves
+        error_feed = self.error.feed
+        task_feed = self.task.feed
+        combat_feed = self.combat.feed
+        resource_feed = self.resource.feed
+        device_feed = self.device.feed
+        navigation_feed = self.navigation.feed
+        akashi_feed = self.akashi.feed
+        loot_feed = self.loot.feed
+        skip_feed = self.skip.feed
+        search_anchor = self.ANCHOR_PATTERN.search
+        first_timestamp = None
+        last_timestamp = None
+        count = 0
+
+        for log in logs:
+            count += 1
+            timestamp = log.timestamp
+            if timestamp:
+                if first_timestamp is None:
+                    first_timestamp = timestamp
+                last_timestamp = timestamp
+
+            error_feed(log, state)
+            task_feed(log, state)
+            combat_feed(log, state)
+            resource_feed(log, state)
+            device_feed(log, state)
+            if search_anchor(log.message):
+                navigation_feed(log, state)
+                akashi_feed(log, state)
+                loot_feed(log, state)
+                skip_feed(log, state)
+
+        self.total_lines += count
+        if last_timestamp:
+            if not self.start_time:
+                self.start_time = first_timestamp
+            self.end_time = last_timestamp
+            state.last_timestamp = last_timestamp
 
     def finalize(self):
         """Called when parsing is complete"""
         self.task.finalize(self.state)
         self.combat.finalize(self.state)
 
+    def merge(self, other: 'AnalyzerPipeline') -> 'AnalyzerPipeline':
+        """Fold in an unfinalized pipeline that parsed the *following* segment.
+
+        Used to combine per-chunk results from parallel_parse().  Analyzer
+        state that spans the boundary (an open task or fight) is stitched
+        together approximately; see the analyzers' merge() methods.
+        """
+        self.task.merge(other.task)
+        self.error.merge(other.error)
+        self.combat.merge(other.combat)
+        self.resource.merge(other.resource)
+        self.navigation.merge(other.navigation)
+        self.device.merge(other.device)
+        self.akashi.merge(other.akashi)
+        self.loot.merge(other.loot)
+        self.skip.merge(other.skip)
+
+        self.total_lines += other.total_lines
+        if not self.start_time:
+            self.start_time = other.start_time
+        if other.end_time:
+            self.end_time = other.end_time
+
+        last_timestamp = other.state.last_timestamp or self.state.last_timestamp
+        self.state = other.state
+        self.state.last_timestamp = last_timestamp
+        return self
+
 
 # ============================================================================
 # Colors (ANSI)
@@ -623,6 +897,18 @@ class Colors:
 # Formatters
 # ============================================================================
 
+_HMS_CACHE: Dict[int, str] = {}
+
+
+def _hms(ts: datetime) -> str:
+    """ts.strftime('%H:%M:%S'), memoised per second of day (strftime is slow)"""
+    key = ts.hour * 3600 + ts.minute * 60 + ts.second
+    text = _HMS_CACHE.get(key)
+    if text is None:
+        text = _HMS_CACHE[key] = ts.strftime('%H:%M:%S')
+    return text
+
+
 class SummaryFormatter:
     """Produces compact single-screen overview"""
 
@@ -642,7 +928,7 @@ class SummaryFormatter:
         if pipeline.start_time and pipeline.end_time:
             duration = pipeline.end_time - pipeline.start_time
             lines.append(f"Session: {pipeline.start_time.strftime('%Y-%m-%d %H:%M:%S')} to "
-                        f"{pipeline.end_time.strftime('%H:%M:%S')}")
+                        f"{_hms(pipeline.end_time)}")
             lines.append(f"Duration: {c(str(duration).split('.')[0], Colors.GREEN)}")
         lines.append(f"Total lines: {c(str(pipeline.total_lines), Colors.CYAN)}")
         lines.append("")
@@ -651,13 +937,21 @@ class SummaryFormatter:
         lines.append(c("Tasks", Colors.BOLD))
         lines.append(c("-" * 60, Colors.DIM))
         if pipeline.task.tasks:
+            # One pass over all runs: name -> [duration sum, runs with a duration, failed]
+            task_stats: Dict[str, list] = defaultdict(lambda: [timedelta(), 0, 0])
+            for t in pipeline.task.tasks:
+                stats = task_stats[t.name]
+                duration = t.duration
+                if duration:
+                    stats[0] += duration
+                    stats[1] += 1
+                if not t.success:
+                    stats[2] += 1
+
             for task_name, count in pipeline.task.task_counts.most_common():
-                # Calculate avg duration
-                task_runs = [t for t in pipeline.task.tasks if t.name == task_name]
-                durations = [t.duration for t in task_runs if t.duration]
-                avg_dur = sum(durations, timedelta()) / len(durations) if durations else None
+                dur_sum, dur_count, failed = task_stats[task_name]
+                avg_dur = dur_sum / dur_count if dur_count else None
 
-                failed = sum(1 for t in task_runs if not t.success)
                 status = c(f"({failed} failed)", Colors.RED) if failed else c("[OK]", Colors.GREEN)
 
                 dur_str = f"avg {str(avg_dur).split('.')[0]}" if avg_dur else "incomplete"
@@ -754,8 +1048,8 @@ class TimelineFormatter:
         lines.append("")
 
         for task in pipeline.task.tasks:
-            start = task.start_time.strftime('%H:%M:%S') if task.start_time else '??:??:??'
-            end = task.end_time.strftime('%H:%M:%S') if task.end_time else 'ongoing'
+            start = _hms(task.start_time) if task.start_time else '??:??:??'
+            end = _hms(task.end_time) if task.end_time else 'ongoing'
             dur = str(task.duration).split('.')[0] if task.duration else '???'
 
             status = c("[OK]", Colors.GREEN) if task.success else c("[FAIL]", Colors.RED)
@@ -783,7 +1077,7 @@ class ErrorFormatter:
         lines.append("")
 
         def format_log(log: LogLine) -> str:
-            time_str = log.timestamp.strftime('%H:%M:%S') if log.timestamp else '???'
+            time_str = _hms(log.timestamp) if log.timestamp else '???'
             msg = log.full_message() if show_trace else log.message
             return f"  {c(time_str, Colors.DIM)} | {msg}"
 
@@ -842,7 +1136,7 @@ class CombatFormatter:
             return "\n".join(lines)
 
         for fight in pipeline.combat.fights:
-            time_str = fight.timestamp.strftime('%H:%M:%S') if fight.timestamp else '???'
+            time_str = _hms(fight.timestamp) if fight.timestamp else '???'
             opp = f"Opponent {fight.opponent}" if fight.opponent else "Unknown"
             try_str = f"Try {fight.try_num}" if fight.try_num else ""
 
@@ -897,7 +1191,7 @@ class ResourceFormatter:
         for resource, readings in sorted(by_type.items()):
             lines.append(c(resource, Colors.CYAN))
             for reading in readings[:10]:  # Limit
-                time_str = reading.timestamp.strftime('%H:%M:%S') if reading.timestamp else '???'
+                time_str = _hms(reading.timestamp) if reading.timestamp else '???'
                 lines.append(f"  {c(time_str, Colors.DIM)} | {reading.value}")
             lines.append("")
 
@@ -911,15 +1205,15 @@ class JsonFormatter:
     def format(pipeline: AnalyzerPipeline) -> str:
         data = {
             'session': {
-                'start_time': pipeline.start_time.isoformat() if pipeline.start_time else None,
-                'end_time': pipeline.end_time.isoformat() if pipeline.end_time else None,
+                'start_time': pipeline.start_time,
+                'end_time': pipeline.end_time,
                 'total_lines': pipeline.total_lines
             },
             'tasks': [
                 {
                     'name': t.name,
-                    'start_time': t.start_time.isoformat() if t.start_time else None,
-                    'end_time': t.end_time.isoformat() if t.end_time else None,
+                    'start_time': t.start_time,
+                    'end_time': t.end_time,
                     'duration_seconds': t.duration.total_seconds() if t.duration else None,
                     'success': t.success,
                     'error_type': t.error_type
@@ -943,7 +1237,21 @@ class JsonFormatter:
                 'connection_errors': len(pipeline.device.connection_errors)
             }
         }
-        return json.dumps(data, indent=2)
+
+        if orjson is not None:
+            # orjson writes datetimes in isoformat() form itself; its output
+            # matches json.dumps(indent=2) except that it never escapes
+            # non-ASCII, so only take it when there is nothing to escape
+            text = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            if text.isascii():
+                return text
+        return json.dumps(data, indent=2, default=JsonFormatter._default)
+
+    @staticmethod
+    def _default(obj: Any) -> Any:
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 # ============================================================================
@@ -968,25 +1276,142 @@ def find_latest_log() -> Optional[Path]:
     return max(log_files, key=lambda p: p.stat().st_mtime)
 
 
-def tail_file(file_path: Path, n: int) -> Iterator[str]:
-    """Read last N lines from file efficiently"""
+def tail_file(file_path: Path, n: int, block_size: int = 64 * 1024) -> Iterator[str]:
+    """Read last N lines from file efficiently
+
+    Reads backwards from EOF in blocks until more than N newlines are in
+    hand (or the start of the file is reached), so long lines never cut the
+    result short and only the needed suffix is decoded.
+    """
     with open(file_path, 'rb') as f:
         # Seek to end
         f.seek(0, 2)
-        file_size = f.tell()
-
-        # Estimate bytes to read (assume ~100 chars per line)
-        bytes_to_read = min(n * 150, file_size)
-        f.seek(max(0, file_size - bytes_to_read))
-
-        # Read and decode
-        lines = f.read().decode('utf-8', errors='replace').splitlines()
+        pos = f.tell()
+
+        blocks = []
+        newlines = 0
+        while pos > 0 and newlines <= n:
+            read = min(block_size, pos)
+            pos -= read
+            f.seek(pos)
+            block = f.read(read)
+            newlines += block.count(b'\n')
+            blocks.append(block)
+
+        # Decode only the collected suffix
+        blocks.reverse()
+        lines = b''.join(blocks).decode('utf-8', errors='replace').splitlines()
 
         # Return last N lines
         for line in lines[-n:]:
             yield line + '\n'
 
 
+# ============================================================================
+# Parallel Parsing
+# ============================================================================
+
+# Target size of the segments a single file is split into for --jobs
+PARALLEL_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def _next_entry_start(mm: mmap.mmap, pos: int) -> int:
+    """Return the offset of the first log entry header at or after *pos*.
+
+    Segments must start on an entry header (timestamp or separator line) so
+    that continuation lines are never split from the entry they belong to.
+    """
+    size = len(mm)
+    if pos > 0 and mm[pos - 1:pos] != b'\n':
+        pos = mm.find(b'\n', pos) + 1
+        if pos == 0:
+            return size
+    while pos < size:
+        end = mm.find(b'\n', pos)
+        if end == -1:
+            end = size
+        line = mm[pos:end].decode('utf-8', errors='replace').rstrip('\r')
+        if LogParser.LINE_PATTERN.match(line):
+            return pos
+        pos = end + 1
+    return size
+
+
+def _plan_chunks(file_path: Path, chunk_bytes: int) -> List[tuple]:
+    """Split a file into (path, start, end, start_line) segments"""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= chunk_bytes:
+            return [(file_path, 0, size, 0)]
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            bounds = [0]
+            pos = chunk_bytes
+            while pos < size:
+                pos = _next_entry_start(mm, pos)
+                if pos >= size:
+                    break
+                bounds.append(pos)
+                pos += chunk_bytes
+            bounds.append(size)
+
+            chunks = []
+            line_count = 0
+            for start, end in zip(bounds, bounds[1:]):
+                chunks.append((file_path, start, end, line_count))
+                line_count += mm[start:end].count(b'\n')
+            return chunks
+
+
+def _parse_chunk(chunk: tuple) -> 'AnalyzerPipeline':
+    """Worker: parse one segment and return its unfinalized pipeline"""
+    file_path, start, end, start_line = chunk
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    # Same decoding and newline handling as the sequential open(..., 'r')
+    lines = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='replace')
+    pipeline = AnalyzerPipeline()
+    pipeline.feed_batch(LogParser.parse(lines, start_line=start_line))
+    return pipeline
+
+
+def parallel_parse(file_paths: Iterable[Path], n_workers: int,
+                   chunk_bytes: int = PARALLEL_CHUNK_BYTES) -> 'AnalyzerPipeline':
+    """Parse one or more logs across worker processes.
+
+    Each file is split into ~chunk_bytes segments aligned to entry headers,
+    and the segments of all files share one process pool, so several
+    ordinary-sized daily logs are parsed in parallel as readily as one huge
+    log.  Partial pipelines are merged in input order.
+
+    The result is not interchangeable with a sequential run.  Entry lists
+    and counters (errors, exceptions, readings, clicks, task and fight
+    starts, ...) match it exactly, but each segment starts with fresh
+    session state, so outcomes that depend on earlier lines (task success
+    and error type, fight TRY/HP, crashes, wins and losses) can differ
+    near segment and file boundaries (see AnalyzerPipeline.merge).
+
+    The returned pipeline is not finalized.
+    """
+    chunks = [chunk for file_path in file_paths
+              for chunk in _plan_chunks(file_path, chunk_bytes)]
+    if len(chunks) <= 1 or n_workers <= 1:
+        parts = map(_parse_chunk, chunks)
+        return _merge_all(parts)
+
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(chunks))) as executor:
+        return _merge_all(executor.map(_parse_chunk, chunks))
+
+
+def _merge_all(parts: Iterator['AnalyzerPipeline']) -> 'AnalyzerPipeline':
+    merged = None
+    for part in parts:
+        merged = part if merged is None else merged.merge(part)
+    return merged if merged is not None else AnalyzerPipeline()
+
+
 # ============================================================================
 # CLI
 # ============================================================================
@@ -1044,6 +1469,10 @@ Examples:
                        help='Only parse last N lines (Single file only)')
     parser.add_argument('--no-color', action='store_true',
                        help='Disable ANSI colors')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                       help='Parse in N worker processes; entry counts are exact, '
+                            'but task/fight outcomes near chunk or file '
+                            'boundaries may differ from a sequential run')
 
     args = parser.parse_args()
 
@@ -1074,16 +1503,12 @@ Examples:
     if args.tail and len(files_to_read) > 1:
         print("Error: --tail only supports single file input", file=sys.stderr)
         sys.exit(1)
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
+        sys.exit(1)
 
     # Initialize Pipeline
     pipeline = AnalyzerPipeline()
-    
-    # Configure Pipeline Options
-    pipeline.options = {
-        'trace': args.trace,
-        'loot': args.loot,
-        'reasons': args.reasons
-    }
 
     # Processing Loop
     if not files_to_read:
@@ -1095,9 +1520,13 @@ Examples:
         else:
             lines = sys.stdin
         
-        for log in LogParser.parse(lines):
-            pipeline.feed(log)
-            
+        pipeline.feed_batch(LogParser.parse(lines))
+
+    elif args.jobs > 1 and not args.tail:
+        # Parallel file mode
+        print(f"Parsing {len(files_to_read)} file(s) with {args.jobs} jobs...", file=sys.stderr)
+        pipeline = parallel_parse(files_to_read, args.jobs)
+
     else:
         # File mode
         print(f"Parsing {len(files_to_read)} file(s)...", file=sys.stderr)
@@ -1108,14 +1537,20 @@ Examples:
             else:
                 lines = open(fpath, 'r', encoding='utf-8', errors='replace')
             
-            for log in LogParser.parse(lines):
-                pipeline.feed(log)
+            pipeline.feed_batch(LogParser.parse(lines))
             
             if not args.tail:
                 lines.close()
 
     pipeline.finalize()
 
+    # Configure Pipeline Options
+    pipeline.options = {
+        'trace': args.trace,
+        'loot': args.loot,
+        'reasons': args.reasons
+    }
+
     # Determine output modes (default to summary)
     modes = []
     if args.summary or not any([args.timeline, args.errors, args.combat, args.resources, args.json]):
@@ -1,11 +1,12 @@
 """Standalone ADB MCP server for Azur Lane automation.
 
 This module provides an MCP (Model Context Protocol) server that exposes
-three ADB-based tools for interacting with an Android device:
+four ADB-based tools for interacting with an Android device:
 
     adb_screenshot  -- Capture the device screen as a PNG image.
     adb_tap         -- Tap a pixel coordinate on the device.
     adb_swipe       -- Swipe between two pixel coordinates.
+    adb_batch       -- Run a sequence of taps, swipes and sleeps at once.
 
 The server uses ``adbutils`` for ADB communication and ``fastmcp`` for the
 MCP transport layer.  It has **no dependency on ALAS internals** -- it talks
@@ -30,16 +31,28 @@ Prerequisites
 -------------
 * An ADB daemon must be running and reachable (``adb start-server``).
 * The target Android device / emulator must be booted and ADB-connectable.
-* Python packages: ``fastmcp>=2.0``, ``adbutils>=2.0``, ``Pillow>=10.0``.
+* Python packages: ``fastmcp>=2.0,<3``, ``adbutils>=2.0``, ``Pillow>=10.0``,
+  ``opencv-python>=4.8``.
 
 Tool details
 ------------
-``adb_screenshot``
-    Returns a ``fastmcp.utilities.types.Image`` wrapping raw PNG bytes.
-    The MCP client receives this as base64-encoded image content.  The
-    screenshot is captured via ``adb exec-out screencap`` under the hood.
-    Passes ``error_ok=False`` to adbutils so a failed capture raises
-    immediately rather than returning a silent black image.
+``adb_screenshot(format="png", quality=85, max_dim=None)``
+    Returns a ``fastmcp.utilities.types.Image`` wrapping PNG (default),
+    JPEG or lossless WebP bytes.  The MCP client receives this as
+    base64-encoded image content (encoded with ``pybase64`` when it is
+    installed).  Plain PNG is captured with ``screencap -p`` and the
+    device's PNG bytes are returned as-is -- no decode/re-encode on the
+    host -- also under ``max_dim`` when the frame already fits.  JPEG,
+    WebP and downscaled frames need host-side pixels, so they read the
+    raw framebuffer (``screencap`` without ``-p``) instead, skipping the
+    device PNG encode and the host PNG decode.  JPEG is
+    encoded with ``cv2.imencode`` (Pillow fallback without OpenCV); WebP
+    losslessly by Pillow at its fastest setting; ``max_dim`` scales larger
+    frames down (bilinear) first.  Capture output that is not a PNG / raw
+    frame raises ``adbutils.AdbError`` immediately rather than producing a
+    silent black image.  When the raw frame is byte-identical to the
+    previous one (same format, quality and ``max_dim``) the previous
+    encoded bytes are reused.
 
 ``adb_tap(x, y)``
     Sends ``adb shell input tap <x> <y>``.  Coordinates are validated to
@@ -50,18 +63,43 @@ Tool details
     is converted from milliseconds (caller-friendly) to seconds (what
     ``adbutils.AdbDevice.swipe`` expects).  Coordinates must be
     non-negative; duration must be positive.
+
+``adb_batch(actions)``
+    Validates every action up front, then sends them as one
+    ``;``-separated shell command (``input tap``, ``input swipe``,
+    ``sleep``), so N actions cost one ADB round-trip instead of N.
+    Nothing is sent if any action is invalid.
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import io
 import logging
+import socket
+import struct
 import sys
+import time
+from typing import Any
 
 import adbutils
 from fastmcp import FastMCP
 from fastmcp.utilities.types import Image
+from mcp.types import Annotations, ImageContent
+from PIL import Image as PILImage
+
+#: OpenCV (and numpy) are imported on first JPEG encode by :func:`_opencv`:
+#: they add ~60 ms to server start-up and PNG screenshots never need them.
+#: ``None`` means unavailable.
+_NOT_LOADED = object()
+cv2: Any = _NOT_LOADED
+np: Any = None
+
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +111,69 @@ logger = logging.getLogger(__name__)
 #: (3840x2160).  Anything beyond this is almost certainly a caller mistake.
 _MAX_COORD = 10_000
 
+#: zlib level used for PNG screenshots.  PNG is lossless at every level; 1
+#: trades a slightly larger payload for a several-fold faster encode, which
+#: is the right call for frames that are consumed once and discarded.
+_PNG_COMPRESSION = 1
+
+#: Seconds a successful device check stays trusted.  Older than this, the
+#: next tool call re-checks the device (one ``get_state()`` round-trip) and
+#: reconnects if the ADB connection has gone stale.
+_HEALTH_CHECK_INTERVAL = 30.0
+
+#: Upper bound on the summed ``sleep`` and swipe durations of one
+#: ``adb_batch`` call.  The whole batch occupies a worker thread (and the
+#: device shell) until it finishes, so it must stay short.
+_MAX_BATCH_MS = 60_000
+
+#: ``adb_batch`` action types and the integer fields each one requires.
+_BATCH_FIELDS = {
+    "tap": ("x", "y"),
+    "swipe": ("x1", "y1", "x2", "y2"),
+    "sleep": ("ms",),
+}
+
+#: Largest single ``recv()`` when reading ``screencap`` output.  A loopback
+#: read returns what the socket has buffered, usually far less than this.
+_READ_SIZE = 1 << 20
+
+#: Seconds a ``screencap`` read may stall before ``adbutils.AdbTimeout``,
+#: matching the per-read timeout ``AdbDevice.shell()`` applies.
+_SHELL_READ_TIMEOUT = 600.0
+
+#: Every PNG stream starts with this 8-byte signature.
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+#: Raw ``screencap`` pixel formats that can be read, mapped to the PIL
+#: ``(mode, rawmode)`` pair: RGBA_8888 and RGBX_8888, 4 bytes per pixel.
+_RAW_PIXEL_MODES = {1: ("RGBA", "RGBA"), 2: ("RGB", "RGBX")}
+
+#: Raw ``screencap`` header sizes: width, height, format (12 bytes), plus a
+#: colour-space word on Android 9+ (16 bytes).
+_RAW_HEADER_SIZES = (12, 16)
+
+#: Set once the device's raw ``screencap`` turns out to use a pixel format
+#: :func:`_raw_to_image` cannot unpack; host encodes then start from the
+#: device PNG instead.
+_raw_unsupported = False
+
+#: Last host encode as ``(frame, (format, quality, max_dim), data)``, where
+#: *frame* is the captured raw dump or PNG.  An idle screen yields
+#: byte-identical frames; comparing the bytes (a memcmp) is far cheaper
+#: than encoding them again.
+_last_encode: tuple[bytes, tuple, bytes] | None = None
+
+#: ``(width, height)`` of the last captured frame, ``None`` before the first.
+#: Lets a PNG request with ``max_dim`` predict whether the frame already fits
+#: and the device's PNG can be passed through.
+_frame_size: tuple[int, int] | None = None
+
+#: Encodings ``adb_screenshot`` can return.  PNG is the device's own output
+#: and stays the default (no host-side encode at all); JPEG is several times
+#: smaller on the wire for game frames; lossless WebP trades a ~20 ms encode
+#: for a somewhat smaller exact-pixel payload.
+_SCREENSHOT_FORMATS = ("png", "jpeg", "webp")
+
 # ---------------------------------------------------------------------------
 # FastMCP server instance
 # ---------------------------------------------------------------------------
@@ -88,16 +189,24 @@ class DeviceConnection:
     """Holds a reusable ADB device connection.
 
     Connects once at startup; all tool calls reuse the same handle.
+    Tools fetch it through :meth:`ensure_alive`, which re-checks the device
+    at most every ``_HEALTH_CHECK_INTERVAL`` seconds and reconnects if the
+    check fails, so a long-running session recovers from a stale ADB
+    connection without paying a round-trip on every tap.
 
     Thread-safety note: this object is **not** thread-safe.  The current
     server runs on stdio (single-client), so concurrent access is not an
-    issue.  If the transport is changed to SSE or HTTP (multi-client),
-    add a lock around ``self._device`` access.
+    issue.  Tools only call into it from the event loop; the screenshot
+    worker thread is handed the ``AdbDevice``, whose ``shell()`` opens its
+    own socket per call.  If the transport is changed to SSE or HTTP
+    (multi-client), add a lock around ``self._device`` access.
     """
 
     def __init__(self, serial: str = "127.0.0.1:21503"):
         self.serial = serial
         self._device: adbutils.AdbDevice | None = None
+        # time.monotonic() of the last good check; 0.0 until first connect.
+        self._last_ok: float = 0.0
 
     def connect(self) -> adbutils.AdbDevice:
         """Connect to the ADB device and return the handle.
@@ -126,13 +235,20 @@ class DeviceConnection:
         self._device = client.device(serial=self.serial)
         # Verify the connection is alive by querying device state.
         try:
-            self._device.get_state()
+            state = self._device.get_state()
         except Exception as exc:
             self._device = None
             raise RuntimeError(
                 f"ADB device {self.serial} is not responding: {exc}"
             ) from exc
+        if state != "device":
+            # "offline", "unauthorized", ... : reachable but not usable.
+            self._device = None
+            raise RuntimeError(
+                f"ADB device {self.serial} is not ready (state {state!r})"
+            )
 
+        self._last_ok = time.monotonic()
         logger.info("Connected to ADB device %s", self.serial)
         return self._device
 
@@ -145,6 +261,40 @@ class DeviceConnection:
             )
         return self._device
 
+    def ensure_alive(self) -> adbutils.AdbDevice:
+        """Return the device handle, reconnecting if it has gone stale.
+
+        Within ``_HEALTH_CHECK_INTERVAL`` of the last successful check this
+        is just an attribute read.  After that, ``get_state()`` is queried
+        once; if it fails or reports anything but ``"device"`` (e.g.
+        ``"offline"``), :meth:`connect` is called to reopen the handle.  If
+        an earlier reconnect failed, every call retries it, so the server
+        recovers once the device is back.
+
+        Raises:
+            RuntimeError: If never connected, or if reconnecting fails.
+        """
+        device = self._device
+        if device is None:
+            if not self._last_ok:
+                return self.device  # never connected: raises
+            return self.connect()
+        now = time.monotonic()
+        if now - self._last_ok < _HEALTH_CHECK_INTERVAL:
+            return device
+        try:
+            state = device.get_state()
+        except Exception as exc:
+            state = exc
+        if state == "device":
+            self._last_ok = now
+            return device
+        logger.warning(
+            "ADB device %s stopped responding (%s); reconnecting",
+            self.serial, state,
+        )
+        return self.connect()
+
 
 # Module-level connection, initialised in main().
 conn = DeviceConnection()
@@ -168,30 +318,325 @@ def _validate_coordinate(name: str, value: int) -> None:
         )
 
 
+# ---------------------------------------------------------------------------
+# Encoding helpers
+# ---------------------------------------------------------------------------
+
+class _ScreenshotImage(Image):
+    """FastMCP ``Image`` whose base64 step uses ``pybase64`` when installed.
+
+    FastMCP turns a returned ``Image`` into MCP content through its public
+    ``to_image_content()``.  This builds the same ``ImageContent`` but
+    encodes with ``pybase64``, whose SIMD encoder is several times faster
+    than the stdlib on multi-megabyte screenshots; the output is identical.
+    """
+
+    def __init__(self, data: bytes, format: str):
+        super().__init__(data=data, format=format)
+        self.mime_type = f"image/{format}"
+
+    def to_image_content(
+        self,
+        mime_type: str | None = None,
+        annotations: Annotations | None = None,
+    ) -> ImageContent:
+        return ImageContent(
+            type="image",
+            data=_b64encode(self.data).decode("ascii"),
+            mimeType=mime_type or self.mime_type,
+            annotations=annotations or self.annotations,
+        )
+
+
+def _opencv() -> Any:
+    """Return the ``cv2`` module, importing it on first call (``None`` if missing)."""
+    global cv2, np
+    if cv2 is _NOT_LOADED:
+        try:
+            import cv2 as _cv2
+            import numpy as _np
+        except ImportError:  # pragma: no cover - opencv-python is a declared dependency
+            _cv2 = _np = None
+        cv2, np = _cv2, _np
+    return cv2
+
+
+def _to_cv2_array(pil_image, drop_alpha: bool = False):
+    """Convert a PIL image to an OpenCV-ordered ndarray.
+
+    Returns ``None`` for modes OpenCV cannot represent directly (palette,
+    CMYK, ...) so the caller can fall back to Pillow.
+    """
+    arr = np.asarray(pil_image)
+    if pil_image.mode == "RGB":
+        return cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
+    if pil_image.mode == "RGBA":
+        code = cv2.COLOR_RGBA2BGR if drop_alpha else cv2.COLOR_RGBA2BGRA
+        return cv2.cvtColor(arr, code)
+    if pil_image.mode == "L":
+        return arr
+    return None
+
+
+def _encode_image(pil_image, fmt: str = "png", quality: int = 85) -> bytes:
+    """Encode a PIL image as PNG, JPEG or lossless WebP bytes.
+
+    OpenCV's encoders run entirely in C and are much faster than Pillow's
+    chunked writers.  OpenCV expects BGR(A) channel order, so RGB(A)
+    frames are swapped once with ``cvtColor``.  Environments without
+    OpenCV, and modes it cannot represent, fall back to Pillow.  WebP
+    always uses Pillow, whose ``method=0`` lossless mode is several times
+    quicker than OpenCV's WebP encoder.
+
+    Args:
+        pil_image: Decoded screenshot frame.
+        fmt: ``"png"`` (lossless), ``"jpeg"`` or ``"webp"`` (lossless).
+        quality: JPEG quality (1-100).  Ignored for PNG and WebP.
+    """
+    jpeg = fmt == "jpeg"
+    if fmt != "webp" and _opencv() is not None:
+        arr = _to_cv2_array(pil_image, drop_alpha=jpeg)
+        if arr is not None:
+            if jpeg:
+                ext, params = ".jpg", [cv2.IMWRITE_JPEG_QUALITY, quality]
+            else:
+                ext, params = ".png", [cv2.IMWRITE_PNG_COMPRESSION, _PNG_COMPRESSION]
+            ok, encoded = cv2.imencode(ext, arr, params)
+            if not ok:
+                raise RuntimeError(
+                    f"cv2.imencode failed to encode screenshot as {fmt}"
+                )
+            return encoded.tobytes()
+
+    buf = io.BytesIO()
+    if jpeg:
+        if pil_image.mode not in ("RGB", "L"):
+            pil_image = pil_image.convert("RGB")
+        pil_image.save(buf, format="JPEG", quality=quality)
+    elif fmt == "webp":
+        pil_image.save(buf, format="WEBP", lossless=True, quality=0, method=0)
+    else:
+        pil_image.save(buf, format="PNG", compress_level=_PNG_COMPRESSION)
+    return buf.getvalue()
+
+
+def _shell_bytes(device: adbutils.AdbDevice, cmdargs: list[str]) -> bytes:
+    """Run *cmdargs* on the device and return its output as bytes.
+
+    ``AdbDevice.shell(..., encoding=None)`` reads the stream 4 KiB at a
+    time and grows the result with ``bytes +=``, copying everything read
+    so far on each step: ~900 reads and ~100 ms for one 720p raw frame.
+    This reads the same stream in large chunks and joins them once.
+
+    Raises:
+        adbutils.AdbTimeout: If the device sends nothing for
+            ``_SHELL_READ_TIMEOUT`` seconds.
+    """
+    chunks = []
+    with device.shell(cmdargs, stream=True) as stream:
+        sock = stream.conn
+        sock.settimeout(_SHELL_READ_TIMEOUT)
+        try:
+            while chunk := sock.recv(_READ_SIZE):
+                chunks.append(chunk)
+        except socket.timeout:
+            raise adbutils.AdbTimeout("adb shell read timeout") from None
+    return b"".join(chunks)
+
+
+def _capture_png(device: adbutils.AdbDevice) -> bytes:
+    """Return the PNG bytes written by ``screencap -p``, unmodified.
+
+    ``AdbDevice.screenshot()`` decodes this same PNG into a PIL image,
+    which only pays off when host-side pixels are needed.
+
+    The check covers the IHDR chunk header too, so callers can read the
+    width and height at bytes 16-24.
+
+    Raises:
+        adbutils.AdbError: If the device output is not a PNG with an
+            IHDR header (screen off, secure surface, truncated stream).
+    """
+    png = _shell_bytes(device, ["screencap", "-p"])
+    if (len(png) < 24 or not png.startswith(_PNG_SIGNATURE)
+            or png[12:16] != b"IHDR"):
+        raise adbutils.AdbError(
+            f"screencap returned no PNG data ({len(png)} bytes)"
+        )
+    return png
+
+
+def _capture_raw(device: adbutils.AdbDevice) -> bytes:
+    """Return the raw framebuffer dump written by ``screencap`` (no ``-p``).
+
+    Used when the host needs pixels anyway (JPEG, WebP, ``max_dim``): it
+    skips both the device-side PNG encode and a host-side PNG decode.
+    The output is validated by :func:`_raw_to_image`.
+    """
+    return _shell_bytes(device, ["screencap"])
+
+
+def _unsupported_raw_format(raw: bytes) -> int | None:
+    """Return the pixel format of a complete raw dump :func:`_raw_to_image`
+    cannot unpack (e.g. RGB_565, BGRA_8888), else ``None``."""
+    if len(raw) < 12:
+        return None
+    width, height, pixel_format = struct.unpack_from("<III", raw)
+    pixels = width * height
+    if pixel_format in _RAW_PIXEL_MODES or not pixels:
+        return None
+    for header in _RAW_HEADER_SIZES:
+        if len(raw) - header in (2 * pixels, 3 * pixels, 4 * pixels):
+            return pixel_format
+    return None
+
+
+def _raw_to_image(raw: bytes) -> PILImage.Image:
+    """Wrap a raw ``screencap`` dump as a PIL image.
+
+    RGBA_8888 frames share *raw*'s buffer; RGBX_8888 frames are unpacked
+    to RGB, which copies the pixels.
+
+    Raises:
+        adbutils.AdbError: If the dump is truncated or uses a pixel format
+            other than RGBA_8888 / RGBX_8888.
+    """
+    if len(raw) >= 12:
+        width, height, pixel_format = struct.unpack_from("<III", raw)
+        header = len(raw) - width * height * 4
+        if (width and height and header in _RAW_HEADER_SIZES
+                and pixel_format in _RAW_PIXEL_MODES):
+            mode, rawmode = _RAW_PIXEL_MODES[pixel_format]
+            return PILImage.frombuffer(
+                mode, (width, height), memoryview(raw)[header:],
+                "raw", rawmode, 0, 1,
+            )
+    raise adbutils.AdbError(
+        f"screencap returned no raw frame ({len(raw)} bytes)"
+    )
+
+
+def _encode_cached(frame_bytes: bytes, fmt: str, quality: int,
+                   max_dim: int | None) -> bytes:
+    """Encode a frame as *fmt*, reusing the previous result if unchanged.
+
+    *frame_bytes* is a raw ``screencap`` dump or, on devices whose raw
+    pixel format is unsupported, the device PNG (decoded with Pillow).
+
+    Frames whose longer side exceeds *max_dim* are first scaled down with
+    bilinear filtering: several times faster than Lanczos, and vision
+    models resample the image again anyway.  The frame is still captured
+    fresh on every call; only the encode of identical bytes with the same
+    settings is skipped.
+    """
+    global _last_encode, _frame_size
+    key = (fmt, quality, max_dim)
+    cached = _last_encode
+    if cached is not None and cached[1] == key and cached[0] == frame_bytes:
+        return cached[2]
+    if frame_bytes.startswith(_PNG_SIGNATURE):
+        frame = PILImage.open(io.BytesIO(frame_bytes))
+    else:
+        frame = _raw_to_image(frame_bytes)
+    _frame_size = frame.size
+    if max_dim is not None and max(frame.size) > max_dim:
+        frame.thumbnail((max_dim, max_dim), PILImage.Resampling.BILINEAR)
+    data = _encode_image(frame, fmt, quality)
+    _last_encode = (frame_bytes, key, data)
+    return data
+
+
 # ---------------------------------------------------------------------------
 # Tool implementations (plain functions, easily testable)
 # ---------------------------------------------------------------------------
 
-def adb_screenshot() -> Image:
+async def adb_screenshot(
+    format: str = "png",
+    quality: int = 85,
+    max_dim: int | None = None,
+) -> Image:
     """Take a screenshot from the connected Android device.
 
-    Returns the screenshot as a FastMCP Image (PNG) that MCP clients can
-    display directly.
+    Returns the screenshot as a FastMCP Image that MCP clients can display
+    directly.  Every call captures and encodes a fresh frame; results are
+    never pipelined from an earlier call, since an agent acting on a stale
+    screen would tap the wrong thing.
+
+    The device health check, capture and any transcode run in a worker
+    thread (``asyncio.to_thread``) so the event loop keeps serving other
+    tool calls while a stale connection is re-checked or the device
+    streams the frame.
+
+    Args:
+        format: ``"png"`` (lossless, default), ``"jpeg"`` or ``"webp"``
+            (lossless).  JPEG payloads are several times smaller, which cuts
+            base64 transport and client decode time when exact pixels are
+            not needed.  WebP keeps exact pixels in a smaller payload than
+            PNG at the cost of a host-side encode.
+        quality: JPEG quality from 1 to 100 (default 85).  Ignored for PNG
+            and WebP.
+        max_dim: If given, frames whose longer side exceeds this many
+            pixels are scaled down (aspect ratio kept) before encoding.
+            Most vision models downsample to well under 1280 px anyway, so
+            e.g. ``768`` cuts the payload several-fold.  Smaller frames are
+            returned unscaled.
 
     Raises:
-        RuntimeError: If the device is not connected.
+        ValueError: If *format* is unsupported, or *quality* or *max_dim*
+            is out of range.
+        RuntimeError: If the device is not connected or cannot be
+            reconnected.
         adbutils.AdbError: If the screenshot capture fails on the device.
     """
-    device = conn.device
-    # Pass error_ok=False so adbutils raises on capture failure instead
-    # of silently returning a black image.
-    pil_image = device.screenshot(error_ok=False)
-
-    buf = io.BytesIO()
-    pil_image.save(buf, format="PNG")
-    png_bytes = buf.getvalue()
-
-    return Image(data=png_bytes, format="png")
+    if format not in _SCREENSHOT_FORMATS:
+        raise ValueError(
+            f"format={format!r} is not supported; "
+            f"expected one of {', '.join(_SCREENSHOT_FORMATS)}"
+        )
+    if not 1 <= quality <= 100:
+        raise ValueError(f"quality={quality} must be between 1 and 100")
+    if max_dim is not None and max_dim < 1:
+        raise ValueError(f"max_dim={max_dim} must be positive")
+
+    data = await asyncio.to_thread(_screenshot_bytes, format, quality, max_dim)
+    return _ScreenshotImage(data=data, format=format)
+
+
+def _screenshot_bytes(fmt: str, quality: int, max_dim: int | None) -> bytes:
+    """Capture a frame and encode it as *fmt* (blocking; run off the loop).
+
+    The device comes from :meth:`DeviceConnection.ensure_alive`, whose
+    check (and any reconnect) can block for seconds on a stale device.
+
+    PNG is the device's own ``screencap -p`` output, passed through as-is
+    whenever no downscale is needed.  With ``max_dim``, the size of the
+    previous frame decides: if it fits, the device PNG is captured and its
+    header checked.  Everything else needs host-side pixels, so it starts
+    from the raw framebuffer.  The first ``max_dim`` PNG therefore takes
+    the raw path even if it fits, and a frame that outgrew ``max_dim``
+    since the last call is captured twice.  If the raw dump uses a pixel
+    format that cannot be unpacked, that call and all later ones decode
+    the device PNG instead.
+    """
+    global _frame_size, _raw_unsupported
+    device = conn.ensure_alive()
+    if fmt == "png" and (max_dim is None or (
+            _frame_size is not None and max(_frame_size) <= max_dim)):
+        png = _capture_png(device)
+        _frame_size = struct.unpack(">II", png[16:24])  # IHDR width, height
+        if max_dim is None or max(_frame_size) <= max_dim:
+            return png
+    if not _raw_unsupported:
+        raw = _capture_raw(device)
+        pixel_format = _unsupported_raw_format(raw)
+        if pixel_format is None:
+            return _encode_cached(raw, fmt, quality, max_dim)
+        _raw_unsupported = True
+        logger.info(
+            "Raw screencap pixel format %d is not supported; "
+            "decoding screencap -p output instead", pixel_format,
+        )
+    return _encode_cached(_capture_png(device), fmt, quality, max_dim)
 
 
 def adb_tap(x: int, y: int) -> str:
@@ -208,12 +653,13 @@ def adb_tap(x: int, y: int) -> str:
 
     Raises:
         ValueError: If coordinates are negative or unreasonably large.
-        RuntimeError: If the device is not connected.
+        RuntimeError: If the device is not connected or cannot be
+            reconnected.
     """
     _validate_coordinate("x", x)
     _validate_coordinate("y", y)
 
-    device = conn.device
+    device = conn.ensure_alive()
     device.click(x, y)
     return f"tapped {x},{y}"
 
@@ -242,7 +688,8 @@ def adb_swipe(
 
     Raises:
         ValueError: If coordinates are invalid or duration is non-positive.
-        RuntimeError: If the device is not connected.
+        RuntimeError: If the device is not connected or cannot be
+            reconnected.
     """
     for name, val in [("x1", x1), ("y1", y1), ("x2", x2), ("y2", y2)]:
         _validate_coordinate(name, val)
@@ -252,12 +699,130 @@ def adb_swipe(
             f"duration_ms={duration_ms} must be positive"
         )
 
-    device = conn.device
+    device = conn.ensure_alive()
     # adbutils swipe() expects duration in seconds (float).
     device.swipe(x1, y1, x2, y2, duration=duration_ms / 1000.0)
     return f"swiped {x1},{y1}->{x2},{y2} ({duration_ms}ms)"
 
 
+def _batch_command(index: int, action: dict) -> tuple[str, str, int]:
+    """Validate one ``adb_batch`` action.
+
+    Returns ``(shell_command, summary, duration_ms)``.  Every value
+    interpolated into the command is checked to be an ``int``, so the
+    script cannot carry anything but numbers.
+    """
+    if not isinstance(action, dict):
+        raise ValueError(
+            f"actions[{index}] must be an object with an 'action' key, "
+            f"got {action!r}"
+        )
+    kind = action.get("action")
+    if kind not in _BATCH_FIELDS:
+        raise ValueError(
+            f"actions[{index}]: action={kind!r} is not supported; "
+            f"expected one of {', '.join(_BATCH_FIELDS)}"
+        )
+    values = {}
+    for name in _BATCH_FIELDS[kind]:
+        value = action.get(name)
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError(
+                f"actions[{index}]: {kind} needs an integer {name!r}, got {value!r}"
+            )
+        values[name] = value
+
+    if kind == "sleep":
+        ms = values["ms"]
+        if not 0 < ms <= _MAX_BATCH_MS:
+            raise ValueError(
+                f"actions[{index}]: ms={ms} must be between 1 and {_MAX_BATCH_MS}"
+            )
+        # Integer arithmetic: a float format would round large values.
+        return f"sleep {ms // 1000}.{ms % 1000:03d}", f"slept {ms}ms", ms
+
+    for name, value in values.items():
+        _validate_coordinate(f"actions[{index}].{name}", value)
+
+    if kind == "tap":
+        x, y = values["x"], values["y"]
+        return f"input tap {x} {y}", f"tapped {x},{y}", 0
+
+    duration_ms = action.get("duration_ms", 300)
+    if (not isinstance(duration_ms, int) or isinstance(duration_ms, bool)
+            or not 0 < duration_ms <= _MAX_BATCH_MS):
+        raise ValueError(
+            f"actions[{index}]: duration_ms={duration_ms!r} must be an integer "
+            f"between 1 and {_MAX_BATCH_MS}"
+        )
+    x1, y1, x2, y2 = values["x1"], values["y1"], values["x2"], values["y2"]
+    return (
+        f"input swipe {x1} {y1} {x2} {y2} {duration_ms}",
+        f"swiped {x1},{y1}->{x2},{y2} ({duration_ms}ms)",
+        duration_ms,
+    )
+
+
+def _batch_shell(script: str) -> str:
+    """Run an ``adb_batch`` script on the health-checked device (blocking;
+    run off the loop, like :func:`_screenshot_bytes`)."""
+    return conn.ensure_alive().shell(script)
+
+
+async def adb_batch(actions: list[dict]) -> str:
+    """Run a sequence of taps, swipes and sleeps in one ADB round-trip.
+
+    All actions are validated before anything is sent, then joined into a
+    single ``;``-separated shell command.  The command runs in a worker
+    thread since sleeps can make it long-running; sleeps and swipe
+    durations may add up to at most ``_MAX_BATCH_MS`` (60 s).  ``input``
+    and ``sleep`` print nothing on success, so any output from the device
+    is reported as an error.
+
+    Args:
+        actions: Ordered list of action dicts, each with an ``"action"`` key:
+
+            * ``{"action": "tap", "x": 100, "y": 200}``
+            * ``{"action": "swipe", "x1": 10, "y1": 20, "x2": 30, "y2": 40,
+              "duration_ms": 300}`` (``duration_ms`` optional, default 300)
+            * ``{"action": "sleep", "ms": 500}``
+
+    Returns:
+        The per-action confirmations joined with ``"; "``, e.g.
+        ``"tapped 100,200; slept 500ms; swiped 10,20->30,40 (300ms)"``.
+
+    Raises:
+        ValueError: If *actions* is empty, any action is invalid, or the
+            batch would run longer than 60 s.  No action is sent in that
+            case.
+        RuntimeError: If the device is not connected or cannot be
+            reconnected.
+        adbutils.AdbError: If the device printed an error.  Actions before
+            the failing one have already run.
+    """
+    if not actions:
+        raise ValueError("actions must contain at least one action")
+
+    commands = []
+    summaries = []
+    total_ms = 0
+    for index, action in enumerate(actions):
+        command, summary, duration_ms = _batch_command(index, action)
+        commands.append(command)
+        summaries.append(summary)
+        total_ms += duration_ms
+    if total_ms > _MAX_BATCH_MS:
+        raise ValueError(
+            f"actions would take {total_ms}ms; sleeps and swipes in one "
+            f"batch may add up to at most {_MAX_BATCH_MS}ms"
+        )
+
+    output = await asyncio.to_thread(_batch_shell, "; ".join(commands))
+    if output.strip():
+        raise adbutils.AdbError(f"adb_batch failed on the device: {output.strip()}")
+    return "; ".join(summaries)
+
+
 # ---------------------------------------------------------------------------
 # Register tools with the MCP server
 # ---------------------------------------------------------------------------
@@ -265,6 +830,7 @@ def adb_swipe(
 mcp.tool(adb_screenshot)
 mcp.tool(adb_tap)
 mcp.tool(adb_swipe)
+mcp.tool(adb_batch)
 
 
 # ---------------------------------------------------------------------------
@@ -5,7 +5,9 @@ All adbutils interactions are mocked -- no real device needed.
 
 from __future__ import annotations
 
+import base64
 import io
+import struct
 from unittest import mock
 
 import pytest
@@ -25,17 +27,56 @@ def _make_pil_image(width: int = 64, height: int = 48) -> PILImage.Image:
     return PILImage.new("RGB", (width, height), color=(128, 64, 32))
 
 
+def _png_bytes(image: PILImage.Image) -> bytes:
+    """Encode *image* as PNG, standing in for ``screencap -p`` output."""
+    buf = io.BytesIO()
+    image.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _raw_bytes(image: PILImage.Image, header_size: int = 16,
+               pixel_format: int = 1) -> bytes:
+    """Encode *image* as a raw ``screencap`` dump (RGBA_8888 by default)."""
+    header = struct.pack("<III", *image.size, pixel_format)
+    return header.ljust(header_size, b"\0") + image.convert("RGBA").tobytes()
+
+
+def _stream(output: bytes, chunk_size: int = 4096) -> mock.MagicMock:
+    """Stand in for the ``AdbConnection`` of ``shell(..., stream=True)``.
+
+    Its socket hands *output* out at most *chunk_size* bytes per ``recv()``,
+    then ``b""`` as the device closes the stream.
+    """
+    reader = io.BytesIO(output)
+    stream = mock.MagicMock()
+    stream.__enter__.return_value = stream
+    stream.conn.recv.side_effect = lambda n: reader.read(min(n, chunk_size))
+    return stream
+
+
 def _make_mock_device() -> mock.Mock:
     """Return a Mock that behaves like an adbutils.AdbDevice.
 
     Mocked methods match the real ``adbutils.AdbDevice`` signatures:
-      - ``screenshot(display_id=None, error_ok=True) -> PIL.Image.Image``
+      - ``shell(cmdargs, stream=True)``: ``screencap -p`` streams
+        ``device.frame`` as PNG, ``screencap`` as a raw dump (see
+        :func:`_stream`); any other command prints nothing (``""``)
       - ``click(x, y, display_id=None) -> None``
       - ``swipe(sx, sy, ex, ey, duration=1.0) -> None``
       - ``get_state() -> str``
     """
     device = mock.Mock()
-    device.screenshot.return_value = _make_pil_image()
+    device.frame = _make_pil_image()
+
+    def shell(cmdargs, **kwargs):
+        if cmdargs == ["screencap", "-p"]:
+            return _stream(_png_bytes(device.frame))
+        if cmdargs == ["screencap"]:
+            return _stream(_raw_bytes(device.frame))
+        return mock.DEFAULT
+
+    device.shell.side_effect = shell
+    device.shell.return_value = ""  # input/sleep print nothing on success
     device.click.return_value = None
     device.swipe.return_value = None
     device.get_state.return_value = "device"
@@ -49,9 +90,20 @@ def mock_device(monkeypatch):
     fake_conn = DeviceConnection(serial="127.0.0.1:99999")
     fake_conn._device = device  # bypass connect()
     monkeypatch.setattr(server, "conn", fake_conn)
+    monkeypatch.setattr(server, "_last_encode", None)
+    monkeypatch.setattr(server, "_frame_size", None)
+    monkeypatch.setattr(server, "_raw_unsupported", False)
     return device
 
 
+@pytest.fixture()
+def fake_adbutils(monkeypatch):
+    """Replace ``server.adbutils`` so ``DeviceConnection.connect()`` stays offline."""
+    fake = mock.Mock()
+    monkeypatch.setattr(server, "adbutils", fake)
+    return fake
+
+
 # ---------------------------------------------------------------------------
 # _validate_coordinate
 # ---------------------------------------------------------------------------
@@ -91,42 +143,367 @@ class TestValidateCoordinate:
 # ---------------------------------------------------------------------------
 
 class TestAdbScreenshot:
-    def test_returns_fastmcp_image(self, mock_device):
+    async def test_returns_fastmcp_image(self, mock_device):
         """Tool returns a FastMCP Image with PNG data."""
         from fastmcp.utilities.types import Image
 
-        result = server.adb_screenshot()
+        result = await server.adb_screenshot()
         assert isinstance(result, Image)
 
-    def test_png_bytes_are_valid(self, mock_device):
+    async def test_png_bytes_are_valid(self, mock_device):
         """The PNG bytes inside the Image can be decoded back to PIL."""
-        result = server.adb_screenshot()
+        result = await server.adb_screenshot()
         # Access the raw bytes stored in the Image helper.
         assert result.data is not None
         img = PILImage.open(io.BytesIO(result.data))
         assert img.format == "PNG"
         assert img.size == (64, 48)
 
-    def test_calls_device_screenshot_with_error_ok_false(self, mock_device):
-        """Underlying device.screenshot() is invoked with error_ok=False."""
-        server.adb_screenshot()
-        mock_device.screenshot.assert_called_once_with(error_ok=False)
+    async def test_captures_with_screencap_png(self, mock_device):
+        """The frame is captured as raw PNG bytes via ``screencap -p``."""
+        await server.adb_screenshot()
+        mock_device.shell.assert_called_once_with(
+            ["screencap", "-p"], stream=True
+        )
+        # AdbDevice.screenshot() would decode the PNG to PIL; it is bypassed.
+        mock_device.screenshot.assert_not_called()
 
-    def test_screenshot_device_error(self, mock_device):
-        """RuntimeError propagates when device.screenshot() fails."""
-        mock_device.screenshot.side_effect = RuntimeError("screen off")
-        with pytest.raises(RuntimeError, match="screen off"):
-            server.adb_screenshot()
+    async def test_png_passes_device_bytes_through(self, mock_device):
+        """PNG output is the device's PNG, not a host-side re-encode."""
+        result = await server.adb_screenshot()
+        assert result.data == _png_bytes(mock_device.frame)
 
-    def test_screenshot_format_is_png(self, mock_device):
+    async def test_screenshot_device_error(self, mock_device):
+        """RuntimeError propagates when the capture command fails."""
+        mock_device.shell.side_effect = RuntimeError("screen off")
+        with pytest.raises(RuntimeError, match="screen off"):
+            await server.adb_screenshot()
+
+    @pytest.mark.parametrize("output", [
+        b"",
+        b"Error: capture failed\n",
+        b"\x89PNG\r\n\x1a\n",  # signature only
+        _png_bytes(_make_pil_image())[:20],  # cut inside IHDR
+        b"\x89PNG\r\n\x1a\n" + b"\0" * 16,  # no IHDR chunk
+    ])
+    async def test_non_png_output_raises(self, mock_device, output):
+        """Non-PNG screencap output raises instead of returning garbage."""
+        import adbutils
+
+        mock_device.shell.side_effect = lambda *args, **kwargs: _stream(output)
+        with pytest.raises(adbutils.AdbError, match="no PNG data"):
+            await server.adb_screenshot()
+
+    async def test_screenshot_format_is_png(self, mock_device):
         """The Image wrapper reports PNG format."""
-        result = server.adb_screenshot()
+        result = await server.adb_screenshot()
         assert result._format == "png"
 
-    def test_screenshot_with_large_image(self, mock_device):
+    async def test_png_preserves_pixels(self, mock_device):
+        """Encoding is lossless and keeps RGB channel order (no BGR swap)."""
+        result = await server.adb_screenshot()
+        img = PILImage.open(io.BytesIO(result.data)).convert("RGB")
+        assert img.getpixel((0, 0)) == (128, 64, 32)
+
+    async def test_png_rgba_preserves_pixels(self, mock_device):
+        """RGBA frames keep their alpha channel intact."""
+        mock_device.frame = PILImage.new("RGBA", (8, 8), color=(10, 20, 30, 40))
+        result = await server.adb_screenshot()
+        img = PILImage.open(io.BytesIO(result.data))
+        assert img.mode == "RGBA"
+        assert img.getpixel((0, 0)) == (10, 20, 30, 40)
+
+    async def test_png_works_without_opencv(self, mock_device, monkeypatch):
+        """PNG capture needs no image codec on the host."""
+        monkeypatch.setattr(server, "cv2", None)
+        result = await server.adb_screenshot()
+        img = PILImage.open(io.BytesIO(result.data))
+        assert img.format == "PNG"
+        assert img.getpixel((0, 0)) == (128, 64, 32)
+
+    async def test_image_content_base64_matches_stdlib(self, mock_device):
+        """MCP image content is standard base64 of the encoded bytes."""
+        result = await server.adb_screenshot()
+        content = result.to_image_content()
+        assert content.mimeType == "image/png"
+        assert content.data == base64.b64encode(result.data).decode("ascii")
+
+    async def test_mcp_response_uses_fast_base64(self, mock_device, monkeypatch):
+        """FastMCP builds the tool response through the pybase64 override."""
+        from fastmcp import Client
+
+        encode = mock.Mock(wraps=server._b64encode)
+        monkeypatch.setattr(server, "_b64encode", encode)
+        async with Client(server.mcp) as client:
+            result = await client.call_tool("adb_screenshot", {})
+
+        [content] = result.content
+        assert content.type == "image"
+        assert content.mimeType == "image/png"
+        assert base64.b64decode(content.data) == _png_bytes(mock_device.frame)
+        encode.assert_called_once()
+
+    async def test_jpeg_format(self, mock_device):
+        """format="jpeg" returns decodable JPEG bytes with a JPEG MIME type."""
+        result = await server.adb_screenshot(format="jpeg")
+        assert result._format == "jpeg"
+        assert result._mime_type == "image/jpeg"
+        img = PILImage.open(io.BytesIO(result.data))
+        assert img.format == "JPEG"
+        assert img.size == (64, 48)
+
+    async def test_jpeg_drops_alpha(self, mock_device):
+        """RGBA frames are flattened to RGB for JPEG."""
+        mock_device.frame = PILImage.new("RGBA", (8, 8), color=(10, 20, 30, 40))
+        result = await server.adb_screenshot(format="jpeg")
+        img = PILImage.open(io.BytesIO(result.data))
+        assert img.mode == "RGB"
+
+    async def test_jpeg_quality_changes_size(self, mock_device):
+        """Lower JPEG quality produces a smaller payload."""
+        noisy = PILImage.effect_noise((128, 128), 64).convert("RGB")
+        mock_device.frame = noisy
+        low = await server.adb_screenshot(format="jpeg", quality=10)
+        high = await server.adb_screenshot(format="jpeg", quality=95)
+        assert len(low.data) < len(high.data)
+
+    async def test_jpeg_falls_back_to_pillow_without_opencv(self, mock_device, monkeypatch):
+        monkeypatch.setattr(server, "cv2", None)
+        result = await server.adb_screenshot(format="jpeg")
+        img = PILImage.open(io.BytesIO(result.data))
+        assert img.format == "JPEG"
+
+    async def test_opencv_imported_on_first_jpeg_only(self, mock_device, monkeypatch):
+        """PNG capture leaves OpenCV unimported; the first JPEG loads it."""
+        monkeypatch.setattr(server, "cv2", server._NOT_LOADED)
+        monkeypatch.setattr(server, "np", None)
+        await server.adb_screenshot()
+        assert server.cv2 is server._NOT_LOADED
+        await server.adb_screenshot(format="jpeg")
+        assert server.cv2.__name__ == "cv2"
+
+    async def test_jpeg_keeps_rgb_channel_order(self, mock_device):
+        """The JPEG encode does not swap red and blue."""
+        result = await server.adb_screenshot(format="jpeg", quality=100)
+        r, g, b = PILImage.open(io.BytesIO(result.data)).getpixel((0, 0))
+        assert r > b
+
+    async def test_jpeg_reused_for_unchanged_frame(self, mock_device, monkeypatch):
+        """An identical frame at the same quality is not encoded again."""
+        encode = mock.Mock(wraps=server._encode_image)
+        monkeypatch.setattr(server, "_encode_image", encode)
+        first = await server.adb_screenshot(format="jpeg")
+        second = await server.adb_screenshot(format="jpeg")
+        assert second.data == first.data
+        assert encode.call_count == 1
+        assert mock_device.shell.call_count == 2  # still captured every time
+
+    async def test_jpeg_cache_misses_on_new_frame_or_quality(self, mock_device, monkeypatch):
+        encode = mock.Mock(wraps=server._encode_image)
+        monkeypatch.setattr(server, "_encode_image", encode)
+        await server.adb_screenshot(format="jpeg", quality=85)
+        await server.adb_screenshot(format="jpeg", quality=50)
+        mock_device.frame = _make_pil_image(32, 32)
+        result = await server.adb_screenshot(format="jpeg", quality=50)
+        assert encode.call_count == 3
+        assert PILImage.open(io.BytesIO(result.data)).size == (32, 32)
+
+    async def test_webp_format_is_lossless(self, mock_device):
+        """format="webp" returns lossless WebP with a WebP MIME type."""
+        result = await server.adb_screenshot(format="webp")
+        assert result._mime_type == "image/webp"
+        img = PILImage.open(io.BytesIO(result.data))
+        assert img.format == "WEBP"
+        assert img.size == (64, 48)
+        assert img.convert("RGB").getpixel((0, 0)) == (128, 64, 32)
+
+    async def test_encode_cache_keyed_on_format(self, mock_device):
+        """Switching format on an unchanged frame re-encodes."""
+        jpeg = await server.adb_screenshot(format="jpeg")
+        webp = await server.adb_screenshot(format="webp")
+        assert PILImage.open(io.BytesIO(jpeg.data)).format == "JPEG"
+        assert PILImage.open(io.BytesIO(webp.data)).format == "WEBP"
+
+    def test_pillow_png_fallback_uses_fast_compression(self, monkeypatch):
+        """Without OpenCV, PNG encodes with the fast zlib level and stays lossless."""
+        monkeypatch.setattr(server, "cv2", None)
+        image = _make_pil_image()
+        with mock.patch.object(image, "save", wraps=image.save) as save:
+            data = server._encode_image(image, "png")
+        assert save.call_args.kwargs["compress_level"] == server._PNG_COMPRESSION
+        assert PILImage.open(io.BytesIO(data)).getpixel((0, 0)) == (128, 64, 32)
+
+    async def test_capture_runs_off_event_loop(self, mock_device):
+        """The blocking capture runs in a worker thread, not on the loop."""
+        import threading
+
+        loop_thread = threading.get_ident()
+        capture_threads = []
+
+        def capture(*args, **kwargs):
+            capture_threads.append(threading.get_ident())
+            return _stream(_png_bytes(_make_pil_image()))
+
+        mock_device.shell.side_effect = capture
+        await server.adb_screenshot()
+        assert capture_threads and capture_threads[0] != loop_thread
+
+    @pytest.mark.parametrize("max_dim, size", [
+        (None, (1280, 720)),
+        (512, (512, 288)),
+        (1024, (1024, 576)),
+    ])
+    async def test_max_dim_scales_down(self, mock_device, max_dim, size):
+        """Frames larger than max_dim shrink with their aspect ratio kept."""
+        mock_device.frame = _make_pil_image(1280, 720)
+        result = await server.adb_screenshot(max_dim=max_dim)
+        img = PILImage.open(io.BytesIO(result.data))
+        assert img.format == "PNG"
+        assert img.size == size
+        assert img.convert("RGB").getpixel((0, 0)) == (128, 64, 32)
+
+    @pytest.mark.parametrize("fmt, pil_format", [("jpeg", "JPEG"), ("webp", "WEBP")])
+    async def test_max_dim_with_other_formats(self, mock_device, fmt, pil_format):
+        mock_device.frame = _make_pil_image(1280, 720)
+        result = await server.adb_screenshot(format=fmt, max_dim=640)
+        img = PILImage.open(io.BytesIO(result.data))
+        assert img.format == pil_format
+        assert img.size == (640, 360)
+
+    async def test_max_dim_larger_than_frame_keeps_size(self, mock_device):
+        """A frame already within max_dim is not scaled."""
+        result = await server.adb_screenshot(max_dim=64)
+        img = PILImage.open(io.BytesIO(result.data))
+        assert img.size == (64, 48)
+        assert img.convert("RGB").getpixel((0, 0)) == (128, 64, 32)
+
+    async def test_max_dim_png_passes_fitting_frame_through(self, mock_device):
+        """Once the frame is known to fit, the device PNG is returned as-is."""
+        await server.adb_screenshot(max_dim=64)  # learns the frame size
+        mock_device.shell.reset_mock()
+        result = await server.adb_screenshot(max_dim=64)
+        mock_device.shell.assert_called_once_with(["screencap", "-p"], stream=True)
+        assert result.data == _png_bytes(mock_device.frame)
+
+    async def test_max_dim_png_rescales_frame_that_grew(self, mock_device):
+        """A frame larger than last time is re-captured raw and scaled down."""
+        await server.adb_screenshot()  # 64x48: fits max_dim=64
+        mock_device.frame = _make_pil_image(128, 96)
+        mock_device.shell.reset_mock()
+        result = await server.adb_screenshot(max_dim=64)
+        assert [c.args[0] for c in mock_device.shell.call_args_list] == [
+            ["screencap", "-p"], ["screencap"],
+        ]
+        assert PILImage.open(io.BytesIO(result.data)).size == (64, 48)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"format": "jpeg"}, {"format": "webp"}, {"max_dim": 32},
+    ])
+    async def test_host_encodes_read_raw_framebuffer(self, mock_device, kwargs):
+        """Formats needing host pixels capture ``screencap`` without ``-p``."""
+        await server.adb_screenshot(**kwargs)
+        mock_device.shell.assert_called_once_with(["screencap"], stream=True)
+
+    @pytest.mark.parametrize("header_size", [12, 16])
+    async def test_raw_header_sizes(self, mock_device, header_size):
+        """Both the pre-Android-9 and the colour-space header are accepted."""
+        mock_device.shell.side_effect = lambda *args, **kwargs: _stream(_raw_bytes(
+            _make_pil_image(), header_size=header_size
+        ))
+        result = await server.adb_screenshot(format="webp")
+        img = PILImage.open(io.BytesIO(result.data)).convert("RGB")
+        assert img.size == (64, 48)
+        assert img.getpixel((0, 0)) == (128, 64, 32)
+
+    async def test_raw_rgbx_frame(self, mock_device):
+        mock_device.shell.side_effect = lambda *args, **kwargs: _stream(_raw_bytes(
+            _make_pil_image(), pixel_format=2
+        ))
+        result = await server.adb_screenshot(format="webp")
+        img = PILImage.open(io.BytesIO(result.data))
+        assert img.mode == "RGB"
+        assert img.getpixel((0, 0)) == (128, 64, 32)
+
+    @pytest.mark.parametrize("output", [
+        b"",
+        b"Error: capture failed\n",
+        _raw_bytes(_make_pil_image())[:-1],  # truncated
+    ])
+    async def test_bad_raw_output_raises(self, mock_device, output):
+        import adbutils
+
+        mock_device.shell.side_effect = lambda *args, **kwargs: _stream(output)
+        with pytest.raises(adbutils.AdbError, match="no raw frame"):
+            await server.adb_screenshot(format="jpeg")
+
+    @pytest.mark.parametrize("pixel_format, bytes_per_pixel", [
+        (5, 4),  # BGRA_8888
+        (4, 2),  # RGB_565
+    ])
+    async def test_unsupported_raw_format_falls_back_to_png(
+            self, mock_device, pixel_format, bytes_per_pixel):
+        """Other raw formats are read from the device PNG, on every later call too."""
+        width, height = mock_device.frame.size
+        raw = (struct.pack("<IIII", width, height, pixel_format, 0)
+               + b"\x7f" * (width * height * bytes_per_pixel))
+
+        def shell(cmdargs, **kwargs):
+            if cmdargs == ["screencap"]:
+                return _stream(raw)
+            return _stream(_png_bytes(mock_device.frame))
+
+        mock_device.shell.side_effect = shell
+        for _ in range(2):
+            result = await server.adb_screenshot(format="jpeg", quality=100)
+            r, g, b = PILImage.open(io.BytesIO(result.data)).getpixel((0, 0))
+            assert r > g > b  # (128, 64, 32), not the raw dump's grey
+        assert [c.args[0] for c in mock_device.shell.call_args_list] == [
+            ["screencap"], ["screencap", "-p"], ["screencap", "-p"],
+        ]
+
+    async def test_capture_reads_whole_stream_and_closes_it(self, mock_device):
+        """The frame arrives over many reads and the stream is closed after."""
+        stream = _stream(_raw_bytes(mock_device.frame), chunk_size=1000)
+        mock_device.shell.side_effect = lambda *args, **kwargs: stream
+        result = await server.adb_screenshot(format="webp")
+        assert PILImage.open(io.BytesIO(result.data)).size == (64, 48)
+        assert stream.conn.recv.call_count > 10
+        stream.__exit__.assert_called_once()
+
+    async def test_stalled_capture_raises_timeout(self, mock_device):
+        import socket
+
+        import adbutils
+
+        stream = _stream(b"")
+        stream.conn.recv.side_effect = socket.timeout
+        mock_device.shell.side_effect = lambda *args, **kwargs: stream
+        with pytest.raises(adbutils.AdbTimeout):
+            await server.adb_screenshot()
+        stream.conn.settimeout.assert_called_once_with(server._SHELL_READ_TIMEOUT)
+        stream.__exit__.assert_called_once()
+
+    @pytest.mark.parametrize("max_dim", [0, -1])
+    async def test_max_dim_must_be_positive(self, mock_device, max_dim):
+        with pytest.raises(ValueError, match="max_dim"):
+            await server.adb_screenshot(max_dim=max_dim)
+        mock_device.shell.assert_not_called()
+
+    async def test_unsupported_format_raises(self, mock_device):
+        with pytest.raises(ValueError, match="not supported"):
+            await server.adb_screenshot(format="bmp")
+        mock_device.shell.assert_not_called()
+
+    @pytest.mark.parametrize("quality", [0, 101, -5])
+    async def test_quality_out_of_range_raises(self, mock_device, quality):
+        with pytest.raises(ValueError, match="between 1 and 100"):
+            await server.adb_screenshot(format="jpeg", quality=quality)
+        mock_device.shell.assert_not_called()
+
+    async def test_screenshot_with_large_image(self, mock_device):
         """Screenshot works with a typical 1280x720 device resolution."""
-        mock_device.screenshot.return_value = _make_pil_image(1280, 720)
-        result = server.adb_screenshot()
+        mock_device.frame = _make_pil_image(1280, 720)
+        result = await server.adb_screenshot()
         img = PILImage.open(io.BytesIO(result.data))
         assert img.size == (1280, 720)
 
@@ -266,6 +643,103 @@ class TestAdbSwipe:
         mock_device.swipe.assert_called_once()
 
 
+# ---------------------------------------------------------------------------
+# adb_batch
+# ---------------------------------------------------------------------------
+
+class TestAdbBatch:
+    async def test_mixed_batch_is_one_shell_call(self, mock_device):
+        result = await server.adb_batch([
+            {"action": "tap", "x": 100, "y": 200},
+            {"action": "sleep", "ms": 150},
+            {"action": "swipe", "x1": 10, "y1": 20, "x2": 30, "y2": 40},
+            {"action": "swipe", "x1": 0, "y1": 0, "x2": 5, "y2": 5,
+             "duration_ms": 1000},
+        ])
+        mock_device.shell.assert_called_once_with(
+            "input tap 100 200; sleep 0.150; input swipe 10 20 30 40 300; "
+            "input swipe 0 0 5 5 1000"
+        )
+        assert result == (
+            "tapped 100,200; slept 150ms; swiped 10,20->30,40 (300ms); "
+            "swiped 0,0->5,5 (1000ms)"
+        )
+
+    async def test_single_action(self, mock_device):
+        result = await server.adb_batch([{"action": "tap", "x": 1, "y": 2}])
+        mock_device.shell.assert_called_once_with("input tap 1 2")
+        assert result == "tapped 1,2"
+
+    async def test_empty_batch_raises(self, mock_device):
+        with pytest.raises(ValueError, match="at least one"):
+            await server.adb_batch([])
+        mock_device.shell.assert_not_called()
+
+    async def test_invalid_action_sends_nothing(self, mock_device):
+        """A bad action late in the list stops the whole batch up front."""
+        with pytest.raises(ValueError, match=r"Coordinate actions\[1\]\.y=-5"):
+            await server.adb_batch([
+                {"action": "tap", "x": 1, "y": 2},
+                {"action": "tap", "x": 1, "y": -5},
+            ])
+        mock_device.shell.assert_not_called()
+
+    @pytest.mark.parametrize("action, match", [
+        ({"action": "press", "x": 1, "y": 2}, "not supported"),
+        ({"action": "tap", "x": 1}, "integer 'y'"),
+        ({"action": "tap", "x": "1; reboot", "y": 2}, "integer 'x'"),
+        ({"action": "tap", "x": True, "y": 2}, "integer 'x'"),
+        ({"action": "swipe", "x1": 1, "y1": 2, "x2": 3, "y2": _MAX_COORD + 1},
+         "exceeds maximum"),
+        ({"action": "swipe", "x1": 1, "y1": 2, "x2": 3, "y2": 4,
+          "duration_ms": 0}, "duration_ms"),
+        ({"action": "swipe", "x1": 1, "y1": 2, "x2": 3, "y2": 4,
+          "duration_ms": server._MAX_BATCH_MS + 1}, "duration_ms"),
+        ({"action": "sleep", "ms": 0}, "between 1 and"),
+        ({"action": "sleep", "ms": 10**9}, "between 1 and"),
+        ({"action": "sleep", "ms": 0.5}, "integer 'ms'"),
+        ([("action", "tap")], r"actions\[0\] must be an object"),
+        ("tap", r"actions\[0\] must be an object"),
+    ])
+    async def test_validation_errors(self, mock_device, action, match):
+        with pytest.raises(ValueError, match=match):
+            await server.adb_batch([action])
+        mock_device.shell.assert_not_called()
+
+    @pytest.mark.parametrize("ms, command", [
+        (1, "sleep 0.001"),
+        (1234, "sleep 1.234"),
+        (59_999, "sleep 59.999"),
+        (server._MAX_BATCH_MS, "sleep 60.000"),
+    ])
+    async def test_sleep_is_formatted_exactly(self, mock_device, ms, command):
+        await server.adb_batch([{"action": "sleep", "ms": ms}])
+        mock_device.shell.assert_called_once_with(command)
+
+    async def test_total_duration_is_capped(self, mock_device):
+        """Actions that are fine alone are rejected if they add up past the cap."""
+        half = server._MAX_BATCH_MS // 2
+        with pytest.raises(ValueError, match="at most"):
+            await server.adb_batch([
+                {"action": "sleep", "ms": half},
+                {"action": "swipe", "x1": 1, "y1": 2, "x2": 3, "y2": 4,
+                 "duration_ms": half},
+                {"action": "sleep", "ms": 1},
+            ])
+        mock_device.shell.assert_not_called()
+
+    async def test_device_output_is_an_error(self, mock_device):
+        """input prints nothing on success, so any output means it failed."""
+        mock_device.shell.return_value = "Error: Unknown command: tap\n"
+        with pytest.raises(server.adbutils.AdbError, match="Unknown command"):
+            await server.adb_batch([{"action": "tap", "x": 1, "y": 2}])
+
+    async def test_device_error_propagates(self, mock_device):
+        mock_device.shell.side_effect = RuntimeError("ADB gone")
+        with pytest.raises(RuntimeError, match="ADB gone"):
+            await server.adb_batch([{"action": "tap", "x": 1, "y": 2}])
+
+
 # ---------------------------------------------------------------------------
 # DeviceConnection
 # ---------------------------------------------------------------------------
@@ -277,54 +751,51 @@ class TestDeviceConnection:
         with pytest.raises(RuntimeError, match="not connected"):
             _ = dc.device
 
-    def test_connect_failure_raises(self):
+    def test_connect_failure_raises(self, fake_adbutils):
         """connect() wraps adbutils errors in RuntimeError."""
         dc = DeviceConnection(serial="192.168.1.999:5555")
-        with mock.patch("mcp_server.server.adbutils") as mock_adb:
-            mock_client = mock.Mock()
-            mock_adb.AdbClient.return_value = mock_client
-            mock_client.connect.side_effect = Exception("connection refused")
+        mock_client = mock.Mock()
+        fake_adbutils.AdbClient.return_value = mock_client
+        mock_client.connect.side_effect = Exception("connection refused")
 
-            with pytest.raises(RuntimeError, match="Failed to connect"):
-                dc.connect()
+        with pytest.raises(RuntimeError, match="Failed to connect"):
+            dc.connect()
 
-    def test_connect_success(self):
+    def test_connect_success(self, fake_adbutils):
         """connect() stores the device handle on success."""
         dc = DeviceConnection(serial="127.0.0.1:21503")
-        with mock.patch("mcp_server.server.adbutils") as mock_adb:
-            mock_client = mock.Mock()
-            mock_adb.AdbClient.return_value = mock_client
-            mock_client.connect.return_value = "already connected to 127.0.0.1:21503"
-            mock_device = mock.Mock()
-            mock_client.device.return_value = mock_device
-            mock_device.get_state.return_value = "device"
-
-            result = dc.connect()
-
-            mock_client.connect.assert_called_once_with(
-                "127.0.0.1:21503", timeout=5.0
-            )
-            assert result is mock_device
-            assert dc.device is mock_device
-
-    def test_connect_device_not_responding(self):
+        mock_client = mock.Mock()
+        fake_adbutils.AdbClient.return_value = mock_client
+        mock_client.connect.return_value = "already connected to 127.0.0.1:21503"
+        mock_device = mock.Mock()
+        mock_client.device.return_value = mock_device
+        mock_device.get_state.return_value = "device"
+
+        result = dc.connect()
+
+        mock_client.connect.assert_called_once_with(
+            "127.0.0.1:21503", timeout=5.0
+        )
+        assert result is mock_device
+        assert dc.device is mock_device
+
+    def test_connect_device_not_responding(self, fake_adbutils):
         """connect() raises when device is reachable but not responding."""
         dc = DeviceConnection(serial="127.0.0.1:21503")
-        with mock.patch("mcp_server.server.adbutils") as mock_adb:
-            mock_client = mock.Mock()
-            mock_adb.AdbClient.return_value = mock_client
-            mock_client.connect.return_value = "already connected to 127.0.0.1:21503"
-            mock_device = mock.Mock()
-            mock_client.device.return_value = mock_device
-            mock_device.get_state.side_effect = Exception("offline")
+        mock_client = mock.Mock()
+        fake_adbutils.AdbClient.return_value = mock_client
+        mock_client.connect.return_value = "already connected to 127.0.0.1:21503"
+        mock_device = mock.Mock()
+        mock_client.device.return_value = mock_device
+        mock_device.get_state.side_effect = Exception("offline")
 
-            with pytest.raises(RuntimeError, match="not responding"):
-                dc.connect()
+        with pytest.raises(RuntimeError, match="not responding"):
+            dc.connect()
 
-            # Device handle should NOT be cached on failure.
-            assert dc._device is None
+        # Device handle should NOT be cached on failure.
+        assert dc._device is None
 
-    def test_connect_soft_failure_unable_to_connect(self):
+    def test_connect_soft_failure_unable_to_connect(self, fake_adbutils):
         """connect() detects 'unable to connect' in the response string.
 
         adbutils.AdbClient.connect() does NOT raise on connection refusal;
@@ -332,44 +803,41 @@ class TestDeviceConnection:
         server must check this string and raise accordingly.
         """
         dc = DeviceConnection(serial="192.168.1.100:5555")
-        with mock.patch("mcp_server.server.adbutils") as mock_adb:
-            mock_client = mock.Mock()
-            mock_adb.AdbClient.return_value = mock_client
-            mock_client.connect.return_value = (
-                "unable to connect to 192.168.1.100:5555"
-            )
+        mock_client = mock.Mock()
+        fake_adbutils.AdbClient.return_value = mock_client
+        mock_client.connect.return_value = (
+            "unable to connect to 192.168.1.100:5555"
+        )
 
-            with pytest.raises(RuntimeError, match="ADB connect.*failed"):
-                dc.connect()
+        with pytest.raises(RuntimeError, match="ADB connect.*failed"):
+            dc.connect()
 
-    def test_connect_soft_failure_failed_to_connect(self):
+    def test_connect_soft_failure_failed_to_connect(self, fake_adbutils):
         """connect() detects 'failed to connect' in the response string."""
         dc = DeviceConnection(serial="1.2.3.4:5555")
-        with mock.patch("mcp_server.server.adbutils") as mock_adb:
-            mock_client = mock.Mock()
-            mock_adb.AdbClient.return_value = mock_client
-            mock_client.connect.return_value = (
-                "failed to connect to '1.2.3.4:5555': Operation timed out"
-            )
+        mock_client = mock.Mock()
+        fake_adbutils.AdbClient.return_value = mock_client
+        mock_client.connect.return_value = (
+            "failed to connect to '1.2.3.4:5555': Operation timed out"
+        )
 
-            with pytest.raises(RuntimeError, match="ADB connect.*failed"):
-                dc.connect()
+        with pytest.raises(RuntimeError, match="ADB connect.*failed"):
+            dc.connect()
 
-    def test_connect_already_connected_succeeds(self):
+    def test_connect_already_connected_succeeds(self, fake_adbutils):
         """'already connected to ...' is treated as success."""
         dc = DeviceConnection(serial="127.0.0.1:21503")
-        with mock.patch("mcp_server.server.adbutils") as mock_adb:
-            mock_client = mock.Mock()
-            mock_adb.AdbClient.return_value = mock_client
-            mock_client.connect.return_value = (
-                "already connected to 127.0.0.1:21503"
-            )
-            mock_device = mock.Mock()
-            mock_client.device.return_value = mock_device
-            mock_device.get_state.return_value = "device"
-
-            result = dc.connect()
-            assert result is mock_device
+        mock_client = mock.Mock()
+        fake_adbutils.AdbClient.return_value = mock_client
+        mock_client.connect.return_value = (
+            "already connected to 127.0.0.1:21503"
+        )
+        mock_device = mock.Mock()
+        mock_client.device.return_value = mock_device
+        mock_device.get_state.return_value = "device"
+
+        result = dc.connect()
+        assert result is mock_device
 
     def test_serial_can_be_updated_before_connect(self):
         """The serial can be changed after construction (used by main())."""
@@ -377,6 +845,135 @@ class TestDeviceConnection:
         dc.serial = "new:5678"
         assert dc.serial == "new:5678"
 
+    def test_ensure_alive_raises_when_not_connected(self):
+        """ensure_alive() before connect() raises like .device does."""
+        dc = DeviceConnection(serial="127.0.0.1:12345")
+        with pytest.raises(RuntimeError, match="not connected"):
+            dc.ensure_alive()
+
+    def test_ensure_alive_skips_check_when_recent(self, monkeypatch):
+        """Within the check interval the cached handle is returned as-is."""
+        dc = DeviceConnection(serial="127.0.0.1:21503")
+        dc._device = mock.Mock()
+        monkeypatch.setattr(server.time, "monotonic", lambda: 100.0)
+        dc._last_ok = 100.0 - server._HEALTH_CHECK_INTERVAL + 1
+
+        assert dc.ensure_alive() is dc._device
+        dc._device.get_state.assert_not_called()
+
+    def test_ensure_alive_checks_when_stale(self, monkeypatch):
+        """After the interval, get_state() is queried once and the timer reset."""
+        dc = DeviceConnection(serial="127.0.0.1:21503")
+        dc._device = mock.Mock()
+        dc._device.get_state.return_value = "device"
+        monkeypatch.setattr(server.time, "monotonic", lambda: 100.0)
+        dc._last_ok = 100.0 - server._HEALTH_CHECK_INTERVAL
+
+        assert dc.ensure_alive() is dc._device
+        assert dc.ensure_alive() is dc._device
+        dc._device.get_state.assert_called_once_with()
+        assert dc._last_ok == 100.0
+
+    def test_ensure_alive_reconnects_when_check_fails(self, fake_adbutils):
+        """A failed health check reopens the connection."""
+        dc = DeviceConnection(serial="127.0.0.1:21503")
+        stale = mock.Mock()
+        stale.get_state.side_effect = Exception("device offline")
+        dc._device = stale
+        mock_client = mock.Mock()
+        fake_adbutils.AdbClient.return_value = mock_client
+        mock_client.connect.return_value = "connected to 127.0.0.1:21503"
+        fresh = mock.Mock()
+        fresh.get_state.return_value = "device"
+        mock_client.device.return_value = fresh
+
+        assert dc.ensure_alive() is fresh
+        assert dc.device is fresh
+
+    @pytest.mark.parametrize("state", ["offline", "unauthorized"])
+    def test_ensure_alive_reconnects_when_not_ready(self, fake_adbutils, state):
+        """A state other than "device" counts as a failed health check."""
+        dc = DeviceConnection(serial="127.0.0.1:21503")
+        dc._device = mock.Mock()
+        dc._device.get_state.return_value = state
+        fresh = mock.Mock()
+        fresh.get_state.return_value = "device"
+        mock_client = fake_adbutils.AdbClient.return_value
+        mock_client.connect.return_value = "connected to 127.0.0.1:21503"
+        mock_client.device.return_value = fresh
+
+        assert dc.ensure_alive() is fresh
+
+    def test_connect_rejects_device_not_ready(self, fake_adbutils):
+        """connect() fails if the device is reachable but e.g. unauthorized."""
+        dc = DeviceConnection(serial="127.0.0.1:21503")
+        mock_client = fake_adbutils.AdbClient.return_value
+        mock_client.connect.return_value = "already connected to 127.0.0.1:21503"
+        mock_client.device.return_value.get_state.return_value = "unauthorized"
+
+        with pytest.raises(RuntimeError, match="not ready.*unauthorized"):
+            dc.connect()
+        assert dc._device is None
+
+    def test_ensure_alive_recovers_after_failed_reconnect(self, fake_adbutils):
+        """get_state() failing during a reconnect does not lock the server out."""
+        dc = DeviceConnection(serial="127.0.0.1:21503")
+        dc._device = mock.Mock()
+        dc._device.get_state.side_effect = Exception("device offline")
+        dc._last_ok = 1.0  # connected once, long ago
+        booting = mock.Mock()
+        booting.get_state.side_effect = Exception("device offline")
+        fresh = mock.Mock()
+        fresh.get_state.return_value = "device"
+        mock_client = fake_adbutils.AdbClient.return_value
+        mock_client.connect.return_value = "already connected to 127.0.0.1:21503"
+        mock_client.device.side_effect = [booting, fresh]
+
+        with pytest.raises(RuntimeError, match="not responding"):
+            dc.ensure_alive()
+        assert dc.ensure_alive() is fresh
+        assert dc.ensure_alive() is fresh
+        assert mock_client.device.call_count == 2
+
+    def test_ensure_alive_reconnect_failure_raises(self, fake_adbutils):
+        """If reconnecting fails, the tool call fails with RuntimeError."""
+        dc = DeviceConnection(serial="127.0.0.1:21503")
+        dc._device = mock.Mock()
+        dc._device.get_state.side_effect = Exception("device offline")
+        fake_adbutils.AdbClient.return_value.connect.side_effect = Exception(
+            "connection refused"
+        )
+        with pytest.raises(RuntimeError, match="Failed to connect"):
+            dc.ensure_alive()
+
+    async def test_tools_use_health_checked_handle(self, mock_device, monkeypatch):
+        """Tool calls go through ensure_alive(), not the bare property."""
+        ensure_alive = mock.Mock(return_value=mock_device)
+        monkeypatch.setattr(server.conn, "ensure_alive", ensure_alive)
+        server.adb_tap(1, 2)
+        server.adb_swipe(1, 2, 3, 4)
+        await server.adb_screenshot()
+        await server.adb_batch([{"action": "tap", "x": 1, "y": 2}])
+        assert ensure_alive.call_count == 4
+
+    async def test_async_tools_check_device_off_event_loop(
+            self, mock_device, monkeypatch):
+        """A slow health check or reconnect does not block the event loop."""
+        import threading
+
+        loop_thread = threading.get_ident()
+        check_threads = []
+
+        def ensure_alive():
+            check_threads.append(threading.get_ident())
+            return mock_device
+
+        monkeypatch.setattr(server.conn, "ensure_alive", ensure_alive)
+        await server.adb_screenshot(format="jpeg")
+        await server.adb_batch([{"action": "tap", "x": 1, "y": 2}])
+        assert len(check_threads) == 2
+        assert loop_thread not in check_threads
+
 
 # ---------------------------------------------------------------------------
 # MCP server tool registration
@@ -385,10 +982,10 @@ class TestDeviceConnection:
 class TestMcpToolRegistration:
     """Verify that tools are correctly registered on the FastMCP instance."""
 
-    def test_server_has_three_tools(self):
-        """The mcp instance has exactly three tools registered."""
+    def test_server_has_four_tools(self):
+        """The mcp instance has exactly four tools registered."""
         tools = server.mcp._tool_manager._tools
-        assert len(tools) == 3
+        assert len(tools) == 4
 
     def test_adb_screenshot_registered(self):
         """adb_screenshot is registered by name."""
@@ -405,8 +1002,13 @@ class TestMcpToolRegistration:
         tools = server.mcp._tool_manager._tools
         assert "adb_swipe" in tools
 
+    def test_adb_batch_registered(self):
+        """adb_batch is registered by name."""
+        tools = server.mcp._tool_manager._tools
+        assert "adb_batch" in tools
+
     def test_tool_names_match_functions(self):
         """Registered tool names match the function names exactly."""
         tools = server.mcp._tool_manager._tools
-        expected = {"adb_screenshot", "adb_tap", "adb_swipe"}
+        expected = {"adb_screenshot", "adb_tap", "adb_swipe", "adb_batch"}
         assert set(tools.keys()) == expected
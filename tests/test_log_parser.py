@@ -0,0 +1,412 @@
+"""Unit tests for the ALAS log parser.
+
+Logs are built in memory (or in ``tmp_path``) -- no real ALAS log needed.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from mcp_server import log_parser
+from mcp_server.log_parser import (
+    AnalyzerPipeline,
+    JsonFormatter,
+    LogParser,
+    SummaryFormatter,
+    PARALLEL_CHUNK_BYTES,
+    _plan_chunks,
+    parallel_parse,
+    tail_file,
+)
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _entry(second: int, level: str, message: str) -> str:
+    """Format one ALAS log line, *second* seconds after 12:00:00."""
+    minutes, seconds = divmod(second, 60)
+    return (f"2026-01-25 12:{minutes:02d}:{seconds:02d}.000 | "
+            f"{level} | {message}\n")
+
+
+def _analyze(*texts: str) -> AnalyzerPipeline:
+    """Parse *texts* sequentially (like the CLI does files) and finalize."""
+    pipeline = AnalyzerPipeline()
+    for text in texts:
+        pipeline.feed_batch(LogParser.parse(io.StringIO(text)))
+    pipeline.finalize()
+    return pipeline
+
+
+def _sample_log(tasks: int = 6) -> str:
+    """A log that exercises every analyzer, with multi-line tracebacks."""
+    lines = []
+    second = 0
+
+    def add(level: str, message: str) -> None:
+        nonlocal second
+        lines.append(_entry(second, level, message))
+        second += 1
+
+    for i in range(tasks):
+        lines.append("═" * 60 + "\n")
+        add("INFO", f"Scheduler: Start task `Task{i % 3}`")
+        add("INFO", f"<<< OPPONENT: {i % 4 + 1} >>>")
+        add("INFO", f"<<< TRY: {i} >>>")
+        add("INFO", f"[{90 - i}% - {40 + i}%]")
+        add("INFO", "<<< COMBAT END >>>")
+        add("INFO", f"[OCR_OIL] {1000 + i}")
+        add("INFO", f"Page switch: page_main -> page_{i}")
+        add("INFO", "Click (100, 200) @ BUTTON")
+        add("INFO", f"Get {i}x 金块")
+        add("WARNING", "adb connection lost, retrying")
+        add("ERROR", f"GameStuckError: stuck {i}")
+        lines.append("Traceback (most recent call last):\n")
+        lines.append(f'  File "module_{i}.py", line {i}, in run\n')
+        add("INFO", f"Channel mismatch fixed in AKASHI_ICON. Sim: 0.9{i}")
+        add("INFO", "Skip task Commission (Reason: No available commission)")
+    return "".join(lines)
+
+
+def _exact_fields(pipeline: AnalyzerPipeline) -> dict:
+    """Results that parallel_parse() must reproduce exactly.
+
+    Leaves out what depends on state carried across lines (task success
+    and error_type, fight TRY/HP/crash), which is approximate across
+    segment boundaries.
+    """
+    task, error = pipeline.task, pipeline.error
+    return {
+        "total_lines": pipeline.total_lines,
+        "session": (pipeline.start_time, pipeline.end_time),
+        "tasks": [(t.name, t.start_time, t.line_start) for t in task.tasks],
+        "task_counts": task.task_counts,
+        "errors": error.errors,
+        "warnings": error.warnings,
+        "criticals": error.criticals,
+        "exception_counts": error.exception_counts,
+        "error_saves": error.error_saves,
+        "fights": [(f.opponent, f.timestamp) for f in pipeline.combat.fights],
+        "readings": pipeline.resource.readings,
+        "page_switches": pipeline.navigation.page_switches,
+        "clicks": pipeline.navigation.click_count,
+        "unknown_pages": pipeline.navigation.unknown_pages,
+        "adb_timeouts": pipeline.device.adb_timeouts,
+        "connection_errors": pipeline.device.connection_errors,
+        "maatouch_events": pipeline.device.maatouch_events,
+        "loot": (pipeline.loot.items, pipeline.loot.recent_loot),
+        "skip_reasons": pipeline.skip.reasons,
+        "akashi": (pipeline.akashi.mismatch_warnings,
+                   pipeline.akashi.max_mismatch_sim),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Pattern matching
+# ---------------------------------------------------------------------------
+
+class TestParseTimestamp:
+    @pytest.mark.parametrize("text", [
+        "2026-01-25 12:00:59.205",
+        "2026-01-25  12:00:59.205",   # LINE_PATTERN allows \s+ here
+        "2026-01-25\t12:00:59.205",
+        "2026-01-25T12:00:59.205",
+        "2026-W04-7 12:00:59.205",    # ISO week date
+        "2026-01-25 12:00:59,205",
+        "2026-02-30 12:00:59.205",
+        "2026-01-25 25:00:59.205",
+        "２０２６-01-25 12:00:59.205",
+        "not a timestamp",
+        "",
+    ])
+    def test_matches_strptime(self, text):
+        """The fromisoformat fast path never accepts or rejects differently."""
+        try:
+            expected = datetime.strptime(text, "%Y-%m-%d %H:%M:%S.%f")
+        except ValueError:
+            with pytest.raises(ValueError):
+                LogParser.parse_timestamp(text)
+        else:
+            assert LogParser.parse_timestamp(text) == expected
+
+    def test_milliseconds(self):
+        assert LogParser.parse_timestamp("2026-01-25 12:00:59.205") == datetime(
+            2026, 1, 25, 12, 0, 59, 205000
+        )
+
+    def test_multi_space_separator_line_is_parsed(self):
+        [log] = LogParser.parse(["2026-01-25   12:00:59.205 | INFO | hi\n"])
+        assert log.timestamp == datetime(2026, 1, 25, 12, 0, 59, 205000)
+
+
+class TestNonAsciiMessages:
+    def test_non_ascii_exception_name_is_counted(self):
+        """Exception names are matched with Unicode \\w, like Python identifiers."""
+        pipeline = _analyze(
+            _entry(0, "INFO", "Scheduler: Start task `Exercise`")
+            + _entry(1, "ERROR", "数据Error: weird")
+        )
+        assert pipeline.error.exception_counts == {"数据Error": 1}
+        assert pipeline.task.tasks[0].error_type == "数据Error"
+
+    def test_non_ascii_exception_marks_fight_crashed(self):
+        pipeline = _analyze(
+            _entry(0, "INFO", "<<< OPPONENT: 2 >>>")
+            + _entry(1, "ERROR", "数据Error: weird")
+        )
+        [fight] = pipeline.combat.fights
+        assert fight.crashed is True
+        assert fight.won is False
+
+    def test_non_ascii_resource_and_template_names(self):
+        pipeline = _analyze(
+            _entry(0, "INFO", "[OCR_燃料] 1200")
+            + _entry(1, "INFO", "Channel mismatch fixed in 明石_ICON. Sim: 0.91")
+        )
+        assert [(r.resource, r.value) for r in pipeline.resource.readings] == [
+            ("燃料", 1200)
+        ]
+        assert pipeline.akashi.mismatch_warnings == {"明石_ICON": 1}
+
+    def test_full_width_digits_are_read(self):
+        pipeline = _analyze(_entry(0, "INFO", "<<< OPPONENT: ３ >>>"))
+        assert pipeline.combat.fights[0].opponent == 3
+
+
+# ---------------------------------------------------------------------------
+# AnalyzerPipeline
+# ---------------------------------------------------------------------------
+
+class TestFeedBatch:
+    @staticmethod
+    def _logs():
+        return list(LogParser.parse(io.StringIO(_sample_log())))
+
+    @staticmethod
+    def _full_state(pipeline: AnalyzerPipeline) -> dict:
+        return {
+            **_exact_fields(pipeline),
+            "task_runs": pipeline.task.tasks,
+            "fights": pipeline.combat.fights,
+            "state": pipeline.state,
+        }
+
+    def test_matches_per_line_feed(self):
+        logs = self._logs()
+        per_line = AnalyzerPipeline()
+        for log in logs:
+            per_line.feed(log)
+        batched = AnalyzerPipeline()
+        batched.feed_batch(logs)
+
+        assert self._full_state(batched) == self._full_state(per_line)
+        per_line.finalize()
+        batched.finalize()
+        assert self._full_state(batched) == self._full_state(per_line)
+        assert JsonFormatter.format(batched) == JsonFormatter.format(per_line)
+
+    def test_split_batches_match_one_batch(self):
+        """Session times and line totals accumulate across calls."""
+        logs = self._logs()
+        once = AnalyzerPipeline()
+        once.feed_batch(logs)
+        split = AnalyzerPipeline()
+        split.feed_batch(logs[:20])
+        split.feed_batch([])
+        split.feed_batch(logs[20:])
+        assert self._full_state(split) == self._full_state(once)
+
+
+# ---------------------------------------------------------------------------
+# JsonFormatter
+# ---------------------------------------------------------------------------
+
+class TestJsonFormatter:
+    ASCII_LOG = (
+        "2026-01-25 12:00:59.205 | INFO | Scheduler: Start task `Exercise`\n"
+        "2026-01-25 12:01:00.000 | ERROR | GameStuckError: stuck\n"
+        "2026-01-25 12:03:30.017 | INFO | Scheduler: Start task `Commission`\n"
+    )
+    NON_ASCII_LOG = (
+        "2026-01-25 12:00:59.205 | INFO | Scheduler: Start task `演习`\n"
+        "2026-01-25 12:01:00.000 | ERROR | 数据Error: 坏了\n"
+        "2026-01-25 12:03:30.017 | INFO | Scheduler: Start task `Commission`\n"
+    )
+
+    @pytest.mark.parametrize("text", [ASCII_LOG, NON_ASCII_LOG, ""])
+    def test_orjson_matches_json_dumps(self, monkeypatch, text):
+        """The optional orjson path is byte-identical to json.dumps(indent=2)."""
+        pytest.importorskip("orjson")
+        pipeline = _analyze(text)
+        fast = JsonFormatter.format(pipeline)
+        monkeypatch.setattr(log_parser, "orjson", None)
+        stdlib = JsonFormatter.format(pipeline)
+
+        assert json.loads(fast) == json.loads(stdlib)
+        assert fast == stdlib
+
+    def test_datetimes_and_non_ascii_round_trip(self):
+        data = json.loads(JsonFormatter.format(_analyze(self.NON_ASCII_LOG)))
+        assert data["session"]["start_time"] == "2026-01-25T12:00:59.205000"
+        assert data["tasks"][0]["name"] == "演习"
+        assert data["tasks"][0]["error_type"] == "数据Error"
+        assert data["tasks"][0]["duration_seconds"] == 150.812
+        assert data["errors"]["exception_types"] == {"数据Error": 1}
+
+
+# ---------------------------------------------------------------------------
+# tail_file
+# ---------------------------------------------------------------------------
+
+class TestTailFile:
+    @staticmethod
+    def _tail(tmp_path, data: bytes, n: int, block_size: int = 64 * 1024):
+        path = tmp_path / "alas.txt"
+        path.write_bytes(data)
+        return list(tail_file(path, n, block_size=block_size))
+
+    @pytest.mark.parametrize("block_size", [1, 3, 7, 64 * 1024])
+    def test_last_lines(self, tmp_path, block_size):
+        data = b"".join(b"line %d\n" % i for i in range(50))
+        assert self._tail(tmp_path, data, 3, block_size) == [
+            "line 47\n", "line 48\n", "line 49\n"
+        ]
+
+    @pytest.mark.parametrize("block_size", [1, 5, 64 * 1024])
+    def test_n_larger_than_file(self, tmp_path, block_size):
+        assert self._tail(tmp_path, b"a\nb\n", 10, block_size) == ["a\n", "b\n"]
+
+    @pytest.mark.parametrize("block_size", [1, 4, 64 * 1024])
+    def test_no_trailing_newline(self, tmp_path, block_size):
+        assert self._tail(tmp_path, b"a\nb\nc", 2, block_size) == ["b\n", "c\n"]
+
+    @pytest.mark.parametrize("block_size", [1, 3, 64 * 1024])
+    def test_crlf_line_endings(self, tmp_path, block_size):
+        data = b"a\r\nb\r\nc\r\n"
+        assert self._tail(tmp_path, data, 2, block_size) == ["b\n", "c\n"]
+
+    @pytest.mark.parametrize("block_size", range(1, 8))
+    def test_multibyte_character_across_block_boundary(self, tmp_path, block_size):
+        """Blocks are joined before decoding, so a split UTF-8 sequence survives."""
+        data = "数据 1\n明石 2\n金块 3\n".encode("utf-8")
+        assert self._tail(tmp_path, data, 2, block_size) == ["明石 2\n", "金块 3\n"]
+
+    def test_line_longer_than_block(self, tmp_path):
+        data = b"x\n" + b"y" * 100 + b"\n"
+        assert self._tail(tmp_path, data, 1, block_size=8) == ["y" * 100 + "\n"]
+
+    def test_empty_file(self, tmp_path):
+        assert self._tail(tmp_path, b"", 5) == []
+
+
+# ---------------------------------------------------------------------------
+# Parallel parsing
+# ---------------------------------------------------------------------------
+
+class TestParallelParse:
+    @pytest.fixture()
+    def log_file(self, tmp_path):
+        path = tmp_path / "alas.txt"
+        path.write_text(_sample_log(), encoding="utf-8")
+        return path
+
+    def test_single_chunk_matches_sequential(self, log_file):
+        """A file that fits in one chunk gives exactly the sequential output."""
+        pipeline = parallel_parse([log_file], n_workers=4)
+        pipeline.finalize()
+        expected = _analyze(_sample_log())
+        assert JsonFormatter.format(pipeline) == JsonFormatter.format(expected)
+        assert SummaryFormatter.format(pipeline) == SummaryFormatter.format(expected)
+
+    @pytest.mark.parametrize("chunk_bytes", [1, 100, 700, 5000])
+    def test_chunks_cover_every_line_once(self, log_file, chunk_bytes):
+        """Chunks tile the file and start on entry headers, so parsing them
+        one by one yields every entry exactly once with its line number."""
+        data = log_file.read_bytes()
+        chunks = _plan_chunks(log_file, chunk_bytes)
+        assert chunks[0][1] == 0
+        assert chunks[-1][2] == len(data)
+        for (_, _, end, _), (_, start, _, _) in zip(chunks, chunks[1:]):
+            assert end == start
+
+        entries = []
+        for _, start, end, start_line in chunks:
+            lines = data[start:end].decode("utf-8").splitlines(keepends=True)
+            entries.extend(LogParser.parse(lines, start_line=start_line))
+        text = data.decode("utf-8")
+        assert entries == list(LogParser.parse(text.splitlines(keepends=True)))
+
+    @pytest.mark.parametrize("chunk_bytes", [1, 100, 700, 5000])
+    def test_merged_counts_are_exact(self, log_file, chunk_bytes):
+        pipeline = parallel_parse([log_file], n_workers=1, chunk_bytes=chunk_bytes)
+        pipeline.finalize()
+        assert _exact_fields(pipeline) == _exact_fields(_analyze(_sample_log()))
+
+    def test_worker_processes_match_in_process(self, log_file):
+        pipeline = parallel_parse([log_file], n_workers=2, chunk_bytes=700)
+        pipeline.finalize()
+        assert _exact_fields(pipeline) == _exact_fields(_analyze(_sample_log()))
+
+    @pytest.mark.parametrize("chunk_bytes", [PARALLEL_CHUNK_BYTES, 1000])
+    def test_multi_file_matches_sequential(self, tmp_path, chunk_bytes):
+        """Files sharing one pool keep their order and file-relative entries."""
+        texts = [_sample_log(tasks) for tasks in (3, 6, 2)]
+        paths = []
+        for day, text in enumerate(texts):
+            path = tmp_path / f"2026-01-2{day}_alas.txt"
+            path.write_text(text, encoding="utf-8")
+            paths.append(path)
+
+        pipeline = parallel_parse(paths, n_workers=2, chunk_bytes=chunk_bytes)
+        pipeline.finalize()
+        assert _exact_fields(pipeline) == _exact_fields(_analyze(*texts))
+
+    def test_no_files_gives_empty_pipeline(self):
+        pipeline = parallel_parse([], n_workers=2)
+        assert pipeline.total_lines == 0
+        assert pipeline.start_time is None
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+class TestCli:
+    """Runs the CLI in a subprocess: --no-color changes class-level state."""
+
+    TEXT_MODES = ("-s", "-t", "-e", "-c", "-r", "--loot", "--reasons", "--trace")
+
+    @staticmethod
+    def _run(*args: str) -> str:
+        result = subprocess.run(
+            [sys.executable, "-m", "mcp_server.log_parser", *args],
+            capture_output=True, text=True, encoding="utf-8",
+            cwd=REPO_ROOT, check=True,
+        )
+        return result.stdout
+
+    @pytest.fixture()
+    def log_file(self, tmp_path):
+        path = tmp_path / "alas.txt"
+        path.write_text(_sample_log(), encoding="utf-8")
+        return str(path)
+
+    def test_no_color_output_has_no_ansi_codes(self, log_file):
+        output = self._run(log_file, *self.TEXT_MODES, "--no-color")
+        assert "Task0" in output
+        assert "\033[" not in output
+
+    def test_colors_are_on_by_default(self, log_file):
+        assert "\033[" in self._run(log_file, *self.TEXT_MODES)